@@ -9,14 +9,20 @@ This script checks:
 Sends Telegram alerts when conditions are met.
 """
 
+import argparse
+import hashlib
 import json
 import logging
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
 from src.config import (
+    Config,
     get_config,
     get_ipo_watchlist,
     get_volatility_watchlist,
@@ -26,12 +32,13 @@ from src.config import (
     ALERT_DAYS_BEFORE,
     MAX_DAYS_AHEAD,
 )
-from src.ipo_checker import IPOInfo, IPOStatus, check_ipo_status
+from src.ipo_checker import IPOInfo, IPOStatus, check_ipo_status, prefetch_nasdaq_calendar
 from src.volatility_checker import VolatilityInfo, check_volatility
 from src.upcoming_ipo_checker import UpcomingIPO, check_upcoming_ipos
 from src.telegram_notifier import TelegramNotifier
 
-# Configure logging
+# Configure logging (no multiprocessing here, so skip collecting process names)
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -43,25 +50,124 @@ IPO_STATE_FILE = Path("ipo_state.json")
 VOLATILITY_STATE_FILE = Path("volatility_state.json")
 UPCOMING_IPO_STATE_FILE = Path("upcoming_ipo_state.json")
 
+# Digest of the last content written to (or found in) each state file, along
+# with the file's (mtime_ns, size) signature at the time, so a file that was
+# deleted or edited since is rewritten rather than assumed unchanged
+_last_state_digest: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+
+# Parsed content of each state file, keyed by the file's (mtime_ns, size)
+# signature, so repeated runs in one process skip re-reading unchanged files
+_state_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, dict]]] = {}
+
+# IPO statuses that trigger an alert when first reached
+_ALERT_STATUSES = frozenset((
+    IPOStatus.SUBSCRIPTION_OPEN,
+    IPOStatus.ALLOTMENT_DONE,
+    IPOStatus.LISTED,
+    IPOStatus.TRADING,
+))
+
+# Final IPO status (as stored in state) - a trading symbol has nothing left to alert on.
+# LISTED is not final: it can still move on to TRADING.
+_TERMINAL_STATUSES = frozenset((IPOStatus.TRADING.value,))
+
+# Maximum number of symbol checks in flight at once (keeps request bursts polite)
+MAX_CONCURRENT_CHECKS = 8
+
 
 def load_state(state_file: Path) -> Dict[str, dict]:
-    """Load previous states from file."""
-    if state_file.exists():
-        try:
-            with open(state_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to load state file {state_file}: {e}")
-    return {}
+    """Load previous states from file (read in a single call).
+
+    The parsed content is cached in memory and reused while the file's
+    modification time and size are unchanged.
+    """
+    try:
+        signature = _file_signature(state_file)
+    except FileNotFoundError:
+        return {}
+    except IOError as e:
+        logger.warning("Failed to load state file %s: %s", state_file, e)
+        return {}
+
+    cached = _state_cache.get(state_file)
+    if cached and cached[0] == signature:
+        return _copy_states(cached[1])
+
+    try:
+        data = state_file.read_bytes()
+    except FileNotFoundError:
+        return {}
+    except IOError as e:
+        logger.warning("Failed to load state file %s: %s", state_file, e)
+        return {}
+
+    try:
+        states = json.loads(data)
+    except json.JSONDecodeError as e:
+        logger.warning("Failed to load state file %s: %s", state_file, e)
+        return {}
+
+    _last_state_digest[state_file] = (signature, _state_digest(data))
+    _state_cache[state_file] = (signature, _copy_states(states))
+    return states
 
 
 def save_state(state_file: Path, states: Dict[str, dict]) -> None:
-    """Save states to file."""
+    """Save states to file.
+
+    Writes to a temporary file first and renames it over the target, so an
+    interrupted run can never leave a truncated state file behind.
+    Skips the write entirely when the content is identical to what is
+    already on disk (the common case when nothing changed).
+    """
+    # Compact separators: these files are machine-read, whitespace only costs space
+    data = json.dumps(states, separators=(",", ":")).encode()
+    digest = _state_digest(data)
+
+    try:
+        signature = _file_signature(state_file)
+    except IOError:
+        signature = None
+
+    if signature is not None:
+        recorded = _last_state_digest.get(state_file)
+        if recorded is None or recorded[0] != signature:
+            try:
+                _last_state_digest[state_file] = (signature, _state_digest(state_file.read_bytes()))
+            except IOError:
+                pass
+        if _last_state_digest.get(state_file) == (signature, digest):
+            logger.info("State file %s unchanged - skipping write", state_file)
+            return
+
+    tmp_file = state_file.with_suffix(state_file.suffix + ".tmp")
     try:
-        with open(state_file, "w") as f:
-            json.dump(states, f, indent=2)
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, state_file)
+        signature = _file_signature(state_file)
+        _last_state_digest[state_file] = (signature, digest)
+        _state_cache[state_file] = (signature, _copy_states(states))
     except IOError as e:
-        logger.error(f"Failed to save state file {state_file}: {e}")
+        logger.error("Failed to save state file %s: %s", state_file, e)
+
+
+def _state_digest(data: bytes) -> bytes:
+    """Hash serialized state content for change detection."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    """Get a cheap (mtime_ns, size) signature used to detect file changes."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _copy_states(states: Dict[str, dict]) -> Dict[str, dict]:
+    """Copy states deep enough that callers can modify per-symbol entries."""
+    return {
+        symbol: dict(state) if isinstance(state, dict) else state
+        for symbol, state in states.items()
+    }
 
 
 def should_send_ipo_alert(current_info: IPOInfo, previous_state: dict) -> bool:
@@ -72,143 +178,144 @@ def should_send_ipo_alert(current_info: IPOInfo, previous_state: dict) -> bool:
     2. Allotment results are announced
     3. Shares become available for trading
     """
-    previous_status = previous_state.get("status")
-    current_status = current_info.status
-
-    # Don't alert if status hasn't changed
-    if previous_status == current_status.value:
-        return False
-
-    # Only alert for these specific events
-    alert_statuses = (
-        IPOStatus.SUBSCRIPTION_OPEN,
-        IPOStatus.ALLOTMENT_DONE,
-        IPOStatus.LISTED,
-        IPOStatus.TRADING,
+    # Alert only on a status change into one of the alerting statuses
+    # (cheap set membership first - most statuses never alert)
+    return (
+        current_info.status in _ALERT_STATUSES
+        and previous_state.get("status") != current_info.status.value
     )
 
-    return current_status in alert_statuses
-
 
-def check_ipo_symbol(symbol: str, notifier: TelegramNotifier, states: Dict[str, dict]) -> None:
-    """Check a single IPO symbol and send alert if needed."""
-    logger.info(f"[IPO] Checking: {symbol}")
+def process_ipo_info(ipo_info: IPOInfo, notifier: TelegramNotifier, states: Dict[str, dict]) -> bool:
+    """Process the fetched status of a single IPO symbol and send alert if needed.
 
-    ipo_info = check_ipo_status(symbol)
-    logger.info(f"  Status: {ipo_info.status.value}")
+    Returns:
+        True if the symbol's stored state changed
+    """
+    symbol = ipo_info.symbol
+    status_value = ipo_info.status.value
+    logger.info("[IPO] Checking: %s", symbol)
+    logger.info("  Status: %s", status_value)
 
     if ipo_info.company_name:
-        logger.info(f"  Company: {ipo_info.company_name}")
+        logger.info("  Company: %s", ipo_info.company_name)
     if ipo_info.price:
-        logger.info(f"  Price: ${ipo_info.price}")
+        logger.info("  Price: $%s", ipo_info.price)
 
     previous_state = states.get(symbol, {})
     previous_status = previous_state.get("status", "unknown")
-    logger.info(f"  Previous status: {previous_status}")
+    logger.info("  Previous status: %s", previous_status)
 
     if should_send_ipo_alert(ipo_info, previous_state):
-        logger.info(f"  Alert condition met - sending notification")
-        if notifier.send_ipo_alert(ipo_info):
-            logger.info(f"  Alert sent successfully")
-        else:
-            logger.error(f"  Failed to send alert")
+        logger.info("  Alert condition met - queueing notification")
+        notifier.enqueue_ipo_alert(ipo_info)
     else:
-        logger.info(f"  No alert conditions met")
+        logger.info("  No alert conditions met")
 
-    states[symbol] = {
-        "status": ipo_info.status.value,
+    new_state = {
+        "status": status_value,
         "company_name": ipo_info.company_name,
         "exchange": ipo_info.exchange,
         "price": ipo_info.price,
     }
+    if previous_state == new_state:
+        return False
+    states[symbol] = new_state
+    return True
 
 
-def check_volatility_symbol(symbol: str, notifier: TelegramNotifier, states: Dict[str, dict]) -> None:
-    """Check a single volatility symbol and send alert if needed."""
-    logger.info(f"[Volatility] Checking: {symbol}")
-
-    previous_state = states.get(symbol, {})
-    previous_price = previous_state.get("price")
+def process_volatility_info(
+    vol_info: VolatilityInfo,
+    previous_price: Optional[float],
+    notifier: TelegramNotifier,
+    states: Dict[str, dict]
+) -> bool:
+    """Process the fetched price of a single volatility symbol and send alert if needed.
 
-    vol_info = check_volatility(symbol, previous_price)
+    Returns:
+        True if the symbol's stored state changed
+    """
+    symbol = vol_info.symbol
+    logger.info("[Volatility] Checking: %s", symbol)
 
     if vol_info.error:
-        logger.warning(f"  Error: {vol_info.error}")
-        return
+        logger.warning("  Error: %s", vol_info.error)
+        return False
 
     if vol_info.current_price:
-        logger.info(f"  Current price: {vol_info.currency} {vol_info.current_price:.2f}")
+        logger.info("  Current price: %s %.2f", vol_info.currency, vol_info.current_price)
     if vol_info.company_name:
-        logger.info(f"  Company: {vol_info.company_name}")
+        logger.info("  Company: %s", vol_info.company_name)
     if previous_price:
-        logger.info(f"  Previous price: {vol_info.currency} {previous_price:.2f}")
+        logger.info("  Previous price: %s %.2f", vol_info.currency, previous_price)
     if vol_info.change_percent is not None:
-        logger.info(f"  Change: {vol_info.change_percent:+.2f}%")
+        logger.info("  Change: %+.2f%%", vol_info.change_percent)
 
     if vol_info.has_significant_movement():
-        logger.info(f"  Significant {vol_info.movement.value} detected - sending alert")
-        if notifier.send_volatility_alert(vol_info):
-            logger.info(f"  Alert sent successfully")
-        else:
-            logger.error(f"  Failed to send alert")
+        logger.info("  Significant %s detected - queueing alert", vol_info.movement.value)
+        notifier.enqueue_volatility_alert(vol_info)
     else:
-        logger.info(f"  No significant movement")
+        logger.info("  No significant movement")
 
     # Update state
-    if vol_info.current_price:
-        states[symbol] = {
-            "price": vol_info.current_price,
-            "company_name": vol_info.company_name,
-            "currency": vol_info.currency,
-        }
+    if not vol_info.current_price:
+        return False
+    new_state = {
+        "price": vol_info.current_price,
+        "company_name": vol_info.company_name,
+        "currency": vol_info.currency,
+    }
+    if states.get(symbol) == new_state:
+        return False
+    states[symbol] = new_state
+    return True
 
 
 def process_upcoming_ipos(
     watchlist: List[UpcomingIPOEntry],
     notifier: TelegramNotifier,
     states: Dict[str, dict]
-) -> None:
-    """Process upcoming IPO watchlist and send alerts."""
+) -> bool:
+    """Process upcoming IPO watchlist and send alerts.
+
+    Returns:
+        True if any symbol's stored state changed
+    """
     if not watchlist:
         logger.info("Upcoming IPO Watchlist: empty")
-        return
+        return False
 
     symbols = [entry.symbol for entry in watchlist]
-    logger.info(f"Upcoming IPO Watchlist: {len(watchlist)} symbol(s): {', '.join(symbols)}")
+    logger.info("Upcoming IPO Watchlist: %s symbol(s): %s", len(watchlist), ", ".join(symbols))
 
     # Check all upcoming IPOs
     upcoming_ipos = check_upcoming_ipos(watchlist)
     today = datetime.now().strftime("%Y-%m-%d")
+    changed = False
+    alerted: List[UpcomingIPO] = []
 
     for ipo in upcoming_ipos:
-        logger.info(f"[Upcoming IPO] Checking: {ipo.symbol}")
+        logger.info("[Upcoming IPO] Checking: %s", ipo.symbol)
 
         if ipo.company_name:
-            logger.info(f"  Company: {ipo.company_name}")
+            logger.info("  Company: %s", ipo.company_name)
         if ipo.expected_date:
-            logger.info(f"  Expected Date: {ipo.format_date()}")
+            logger.info("  Expected Date: %s", ipo.format_date())
         if ipo.days_until_ipo is not None:
-            logger.info(f"  Days until IPO: {ipo.days_until_ipo}")
+            logger.info("  Days until IPO: %s", ipo.days_until_ipo)
 
         previous_state = states.get(ipo.symbol, {})
         last_alert_date = previous_state.get("last_alert_date")
 
         # Only alert once per day
         if ipo.should_alert and last_alert_date != today:
-            logger.info(f"  Alert condition met (IPO within {ALERT_DAYS_BEFORE} days) - sending notification")
-            if notifier.send_upcoming_ipo_alert(ipo):
-                logger.info(f"  Alert sent successfully")
-                states[ipo.symbol] = {
-                    "last_alert_date": today,
-                    "expected_date": ipo.format_date(),
-                    "company_name": ipo.company_name,
-                }
-            else:
-                logger.error(f"  Failed to send alert")
+            logger.info("  Alert condition met (IPO within %s days) - queueing notification", ALERT_DAYS_BEFORE)
+            notifier.enqueue_upcoming_ipo_alert(ipo)
+            alerted.append(ipo)
         elif ipo.should_alert:
-            logger.info(f"  Already alerted today - skipping")
+            logger.info("  Already alerted today - skipping")
         else:
-            logger.info(f"  No alert needed (IPO not within {ALERT_DAYS_BEFORE} days)")
+            logger.info("  No alert needed (IPO not within %s days)", ALERT_DAYS_BEFORE)
 
             # Still update state for tracking
             if ipo.symbol not in states:
@@ -216,54 +323,219 @@ def process_upcoming_ipos(
                     "expected_date": ipo.format_date(),
                     "company_name": ipo.company_name,
                 }
+                changed = True
 
+    # Send all queued alerts at once; only record them as sent on success
+    if alerted:
+        if notifier.flush():
+            logger.info("Upcoming IPO alerts sent successfully")
+            for ipo in alerted:
+                states[ipo.symbol] = {
+                    "last_alert_date": today,
+                    "expected_date": ipo.format_date(),
+                    "company_name": ipo.company_name,
+                }
+            changed = True
+        else:
+            logger.error("Failed to send upcoming IPO alerts")
 
-def main() -> int:
-    """Main entry point."""
-    logger.info("Starting Alerting System")
+    return changed
+
+
+def create_notifiers(config: Config) -> Tuple[TelegramNotifier, TelegramNotifier, TelegramNotifier]:
+    """Create separate notifiers for the IPO, volatility and upcoming IPO bots."""
+    return (
+        TelegramNotifier(config.ipo_bot.bot_token, config.ipo_bot.chat_id),
+        TelegramNotifier(config.volatility_bot.bot_token, config.volatility_bot.chat_id),
+        TelegramNotifier(config.upcoming_ipo_bot.bot_token, config.upcoming_ipo_bot.chat_id),
+    )
 
-    # Load configuration
-    try:
-        config = get_config()
-    except ValueError as e:
-        logger.error(f"Configuration error: {e}")
-        return 1
 
-    # Initialize separate notifiers for each alert type
-    ipo_notifier = TelegramNotifier(config.ipo_bot.bot_token, config.ipo_bot.chat_id)
-    volatility_notifier = TelegramNotifier(config.volatility_bot.bot_token, config.volatility_bot.chat_id)
-    upcoming_ipo_notifier = TelegramNotifier(config.upcoming_ipo_bot.bot_token, config.upcoming_ipo_bot.chat_id)
+def run_checks(
+    ipo_notifier: TelegramNotifier,
+    volatility_notifier: TelegramNotifier,
+    upcoming_ipo_notifier: TelegramNotifier
+) -> bool:
+    """Run one round of IPO, volatility and upcoming IPO checks.
 
-    # Process IPO watchlist
+    Returns:
+        True if there was activity (an alert, or an IPO / upcoming IPO state
+        change); routine volatility price updates do not count
+    """
     ipo_watchlist = get_ipo_watchlist()
+    volatility_watchlist = get_volatility_watchlist()
+
     if ipo_watchlist:
-        logger.info(f"IPO Watchlist: {len(ipo_watchlist)} symbol(s): {', '.join(ipo_watchlist)}")
-        ipo_states = load_state(IPO_STATE_FILE)
-        for symbol in ipo_watchlist:
-            check_ipo_symbol(symbol, ipo_notifier, ipo_states)
-        save_state(IPO_STATE_FILE, ipo_states)
+        logger.info("IPO Watchlist: %s symbol(s): %s", len(ipo_watchlist), ", ".join(ipo_watchlist))
     else:
         logger.info("IPO Watchlist: empty")
-
-    # Process volatility watchlist
-    volatility_watchlist = get_volatility_watchlist()
     if volatility_watchlist:
-        logger.info(f"Volatility Watchlist: {len(volatility_watchlist)} symbol(s): {', '.join(volatility_watchlist)}")
-        volatility_states = load_state(VOLATILITY_STATE_FILE)
-        for symbol in volatility_watchlist:
-            check_volatility_symbol(symbol, volatility_notifier, volatility_states)
-        save_state(VOLATILITY_STATE_FILE, volatility_states)
+        logger.info("Volatility Watchlist: %s symbol(s): %s", len(volatility_watchlist), ", ".join(volatility_watchlist))
     else:
         logger.info("Volatility Watchlist: empty")
 
+    shared = set(ipo_watchlist).intersection(volatility_watchlist)
+    if shared:
+        logger.info("Symbols in both IPO and volatility watchlists: %s", ", ".join(sorted(shared)))
+
+    ipo_states = load_state(IPO_STATE_FILE) if ipo_watchlist else {}
+
+    # No need to hit the network for IPOs that are already trading
+    pending_ipo_symbols = []
+    for symbol in ipo_watchlist:
+        status = ipo_states.get(symbol, {}).get("status")
+        if status in _TERMINAL_STATUSES:
+            logger.info("[IPO] Skipping %s: already %s", symbol, status)
+        else:
+            pending_ipo_symbols.append(symbol)
+
+    volatility_states = load_state(VOLATILITY_STATE_FILE) if volatility_watchlist else {}
+    previous_prices = {
+        symbol: volatility_states.get(symbol, {}).get("price") for symbol in volatility_watchlist
+    }
+
+    # Fetch all IPO and volatility checks concurrently (the work is network-bound),
+    # then process the results in watchlist order so logs and alerts stay sequential.
+    # The upcoming IPO watchlist refresh (multi-source, only needed afterwards)
+    # runs in the background at the same time.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CHECKS) as executor:
+        refresh_future = executor.submit(refresh_upcoming_ipo_watchlist)
+        if pending_ipo_symbols:
+            # Warm the shared NASDAQ calendar once instead of in every IPO check
+            executor.submit(prefetch_nasdaq_calendar)
+        ipo_futures = [executor.submit(check_ipo_status, symbol) for symbol in pending_ipo_symbols]
+        volatility_futures = [
+            executor.submit(check_volatility, symbol, previous_prices[symbol])
+            for symbol in volatility_watchlist
+        ]
+
+        # Track changes per state file so untouched files are never re-serialized
+        ipo_changed = False
+        for future in ipo_futures:
+            ipo_changed |= process_ipo_info(future.result(), ipo_notifier, ipo_states)
+        volatility_changed = False
+        for symbol, future in zip(volatility_watchlist, volatility_futures):
+            volatility_changed |= process_volatility_info(
+                future.result(), previous_prices[symbol], volatility_notifier, volatility_states
+            )
+
+    alerts_queued = ipo_notifier.has_pending() or volatility_notifier.has_pending()
+
+    # Send the alerts queued during processing, one batched message per bot
+    for name, notifier in (("IPO", ipo_notifier), ("Volatility", volatility_notifier)):
+        if not notifier.flush():
+            logger.error("Failed to send %s alerts", name)
+
+    if ipo_changed:
+        save_state(IPO_STATE_FILE, ipo_states)
+    if volatility_changed:
+        save_state(VOLATILITY_STATE_FILE, volatility_states)
+
     # Process upcoming IPO watchlist
-    # Refresh watchlist from NASDAQ API (only IPOs within MAX_DAYS_AHEAD days)
-    refresh_upcoming_ipo_watchlist()
+    # (refreshed above from the IPO calendars, only IPOs within MAX_DAYS_AHEAD days)
+    refresh_future.result()
 
     upcoming_ipo_watchlist = get_upcoming_ipo_watchlist()
     upcoming_ipo_states = load_state(UPCOMING_IPO_STATE_FILE)
-    process_upcoming_ipos(upcoming_ipo_watchlist, upcoming_ipo_notifier, upcoming_ipo_states)
-    save_state(UPCOMING_IPO_STATE_FILE, upcoming_ipo_states)
+    upcoming_changed = process_upcoming_ipos(upcoming_ipo_watchlist, upcoming_ipo_notifier, upcoming_ipo_states)
+    if upcoming_changed:
+        save_state(UPCOMING_IPO_STATE_FILE, upcoming_ipo_states)
+
+    return alerts_queued or ipo_changed or upcoming_changed
+
+
+def run_forever(
+    interval: int,
+    max_interval: int,
+    notifiers: Tuple[TelegramNotifier, TelegramNotifier, TelegramNotifier]
+) -> None:
+    """Run checks repeatedly in a single long-lived process.
+
+    Keeps the interpreter, config, HTTP connections and caches warm between
+    runs instead of paying process startup and imports on every check.
+
+    The wait between runs starts at `interval` seconds and doubles after
+    every quiet run (up to `max_interval`), dropping back to `interval` as
+    soon as a run has activity.
+    """
+    current_interval = interval
+    while True:
+        started = time.monotonic()
+        try:
+            active = run_checks(*notifiers)
+        except Exception:
+            logger.exception("Check run failed")
+            active = False
+
+        if active:
+            current_interval = interval
+        else:
+            current_interval = min(max_interval, current_interval * 2)
+        logger.info("Check complete - next check in %s seconds", current_interval)
+
+        elapsed = time.monotonic() - started
+        time.sleep(max(0.0, current_interval - elapsed))
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for a whole number of seconds (at least 1)."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="IPO, Volatility, and Upcoming IPO Alerting System")
+    parser.add_argument(
+        "--interval",
+        type=_positive_int,
+        default=None,
+        help="Keep running and repeat the checks every INTERVAL seconds (default: run once)",
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=_positive_int,
+        default=None,
+        help="Back off up to MAX_INTERVAL seconds while nothing changes (default: no backoff)",
+    )
+    args = parser.parse_args(argv)
+    if args.max_interval is not None:
+        if args.interval is None:
+            parser.error("--max-interval requires --interval")
+        if args.max_interval < args.interval:
+            parser.error("--max-interval must not be less than --interval")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parse_args(argv)
+    logger.info("Starting Alerting System")
+
+    # Load configuration
+    try:
+        config = get_config()
+    except ValueError as e:
+        logger.error("Configuration error: %s", e)
+        return 1
+
+    notifiers = create_notifiers(config)
+
+    if args.interval is not None:
+        max_interval = args.max_interval or args.interval
+        logger.info("Running continuously every %s-%s seconds", args.interval, max_interval)
+        try:
+            run_forever(args.interval, max_interval, notifiers)
+        except KeyboardInterrupt:
+            logger.info("Stopped")
+        return 0
+
+    run_checks(*notifiers)
 
     logger.info("Check complete")
     return 0
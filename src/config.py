@@ -1,13 +1,17 @@
 """Configuration management for IPO Alerting System."""
 
+import json
 import logging
 import os
-import platform
-import subprocess
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -19,26 +23,72 @@ UPCOMING_IPO_WATCHLIST_FILE = Path(__file__).parent.parent / "upcomingIPOList.tx
 # Keychain service name for local secrets
 KEYCHAIN_ACCOUNT = "IPOAlertingSystem"
 
+# Bot settings: (Config field, token secret, chat ID secret, bot to fall back to).
+# A bot without a fallback is required; fallbacks must be listed before their users.
+_BOT_SPECS = (
+    ("ipo_bot", "TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID", None),
+    ("volatility_bot", "VOLATILITY_BOT_TOKEN", "VOLATILITY_CHAT_ID", "ipo_bot"),
+    ("upcoming_ipo_bot", "UPCOMING_IPO_BOT_TOKEN", "UPCOMING_IPO_CHAT_ID", "ipo_bot"),
+)
 
+# Keychain is only available on macOS
+_IS_DARWIN = sys.platform == "darwin"
+
+# Columns in the upcoming IPO watchlist are separated by 2+ spaces
+_COL_SPLIT_RE = re.compile(r"\s{2,}")
+
+# Column names in the upcoming IPO watchlist header row (their offsets give column starts)
+_COL_NAME_RE = re.compile(r"\S+")
+
+# Upcoming IPO watchlist lines that hold no entry: comments, header row, separator
+_NON_ENTRY_PREFIXES = ("#", "SYMBOL", "-")
+
+# Timestamp line in generated watchlist headers (ignored when checking for changes)
+_TIMESTAMP_LINE_RE = re.compile(r"^# Last updated: .*$", re.MULTILINE)
+
+# Accepted watchlist dates: YYYY-MM-DD, YYYY/MM/DD, MM/DD/YYYY and MM/DD/YY
+_DATE_RE = re.compile(
+    r"(?:(\d{4})-(\d{1,2})-(\d{1,2})|(\d{4})/(\d{1,2})/(\d{1,2})|(\d{1,2})/(\d{1,2})/(\d{4}|\d{2}))"
+)
+
+
+@lru_cache(maxsize=16)
 def get_from_keychain(service: str) -> Optional[str]:
-    """Retrieve a secret from macOS Keychain."""
-    if platform.system() != "Darwin":
+    """Retrieve a secret from macOS Keychain (each service is looked up once)."""
+    if not _IS_DARWIN:
         return None
 
+    # Only needed on macOS, so don't pay for the import elsewhere (e.g. CI)
+    import subprocess
+
     try:
         result = subprocess.run(
             ["security", "find-generic-password", "-a", KEYCHAIN_ACCOUNT, "-s", service, "-w"],
             capture_output=True,
-            text=True,
         )
         if result.returncode == 0:
-            return result.stdout.strip()
+            # Decode the raw bytes once instead of wrapping the pipes in text mode
+            return result.stdout.strip().decode("utf-8")
     except Exception:
         pass
     return None
 
 
-@dataclass
+def _get_secrets(names: List[str]) -> Dict[str, Optional[str]]:
+    """Get secrets from environment variables, falling back to Keychain on macOS.
+
+    Secrets missing from the environment are looked up in Keychain
+    concurrently, since each lookup spawns a separate security process.
+    """
+    secrets = {name: os.environ.get(name) for name in names}
+    missing = [name for name, value in secrets.items() if not value]
+    if missing and _IS_DARWIN:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            secrets.update(zip(missing, executor.map(get_from_keychain, missing)))
+    return secrets
+
+
+@dataclass(slots=True)
 class BotConfig:
     """Telegram bot configuration."""
 
@@ -46,7 +96,7 @@ class BotConfig:
     chat_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Application configuration loaded from environment variables or Keychain."""
 
@@ -57,89 +107,92 @@ class Config:
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables, falling back to Keychain on macOS."""
-        # IPO Bot configuration
-        ipo_token = os.environ.get("TELEGRAM_BOT_TOKEN")
-        ipo_chat_id = os.environ.get("TELEGRAM_CHAT_ID")
-
-        if not ipo_token:
-            ipo_token = get_from_keychain("TELEGRAM_BOT_TOKEN")
-        if not ipo_chat_id:
-            ipo_chat_id = get_from_keychain("TELEGRAM_CHAT_ID")
-
-        if not ipo_token:
-            raise ValueError("TELEGRAM_BOT_TOKEN not found in environment or Keychain")
-        if not ipo_chat_id:
-            raise ValueError("TELEGRAM_CHAT_ID not found in environment or Keychain")
-
-        # Volatility Bot configuration (falls back to IPO bot if not configured)
-        vol_token = os.environ.get("VOLATILITY_BOT_TOKEN")
-        vol_chat_id = os.environ.get("VOLATILITY_CHAT_ID")
-
-        if not vol_token:
-            vol_token = get_from_keychain("VOLATILITY_BOT_TOKEN")
-        if not vol_chat_id:
-            vol_chat_id = get_from_keychain("VOLATILITY_CHAT_ID")
-
-        if not vol_token:
-            vol_token = ipo_token
-        if not vol_chat_id:
-            vol_chat_id = ipo_chat_id
-
-        # Upcoming IPO Bot configuration (falls back to IPO bot if not configured)
-        upcoming_token = os.environ.get("UPCOMING_IPO_BOT_TOKEN")
-        upcoming_chat_id = os.environ.get("UPCOMING_IPO_CHAT_ID")
-
-        if not upcoming_token:
-            upcoming_token = get_from_keychain("UPCOMING_IPO_BOT_TOKEN")
-        if not upcoming_chat_id:
-            upcoming_chat_id = get_from_keychain("UPCOMING_IPO_CHAT_ID")
-
-        if not upcoming_token:
-            upcoming_token = ipo_token
-        if not upcoming_chat_id:
-            upcoming_chat_id = ipo_chat_id
-
-        return cls(
-            ipo_bot=BotConfig(bot_token=ipo_token, chat_id=ipo_chat_id),
-            volatility_bot=BotConfig(bot_token=vol_token, chat_id=vol_chat_id),
-            upcoming_ipo_bot=BotConfig(bot_token=upcoming_token, chat_id=upcoming_chat_id),
-        )
+        secrets = _get_secrets([name for _, token, chat_id, _ in _BOT_SPECS for name in (token, chat_id)])
+
+        bots: Dict[str, BotConfig] = {}
+        for field_name, token_name, chat_id_name, fallback in _BOT_SPECS:
+            bot_token = secrets[token_name]
+            chat_id = secrets[chat_id_name]
+
+            if fallback is None:
+                # Required bot (the IPO bot)
+                if not bot_token:
+                    raise ValueError(f"{token_name} not found in environment or Keychain")
+                if not chat_id:
+                    raise ValueError(f"{chat_id_name} not found in environment or Keychain")
+            else:
+                # Other bots fall back to the IPO bot if not configured
+                bot_token = bot_token or bots[fallback].bot_token
+                chat_id = chat_id or bots[fallback].chat_id
+
+            bots[field_name] = BotConfig(bot_token=bot_token, chat_id=chat_id)
 
+        return cls(**bots)
 
+
+@lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Get application configuration."""
+    """Get application configuration (loaded once and cached)."""
     return Config.from_env()
 
 
+@lru_cache(maxsize=None)
+def _env_path(env_var: str, default: Path) -> Path:
+    """Get a file path from an environment variable override, or the default.
+
+    Resolved once per process; call _env_path.cache_clear() after changing
+    the environment.
+    """
+    return Path(os.environ.get(env_var, default))
+
+
+# Parsed watchlist files: path -> ((mtime_ns, size) when parsed, entries)
+_watchlist_cache: Dict[Path, Tuple[Tuple[int, int], list]] = {}
+
+
+def _file_signature(file_path: Path) -> Tuple[int, int]:
+    """Get a cheap (mtime_ns, size) signature used to detect file changes."""
+    stat = file_path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
 def _read_watchlist_file(file_path: Path) -> List[str]:
-    """Read symbols from a watchlist file (one symbol per line)."""
-    if not file_path.exists():
+    """Read symbols from a watchlist file (one symbol per line).
+
+    Duplicate symbols are dropped, keeping the first occurrence. Parsed
+    results are cached and only re-read when the file's mtime or size changes.
+    """
+    try:
+        signature = _file_signature(file_path)
+    except FileNotFoundError:
         return []
 
-    symbols = []
-    with open(file_path, "r") as f:
-        for line in f:
-            symbol = line.strip().upper()
-            # Skip empty lines and comments
-            if symbol and not symbol.startswith("#"):
-                symbols.append(symbol)
+    cached = _watchlist_cache.get(file_path)
+    if cached and cached[0] == signature:
+        return list(cached[1])
+
+    # Uppercase the whole file in one call rather than line by line
+    lines = file_path.read_text(encoding="utf-8").upper().splitlines()
+    # Skip empty lines and comments; dict.fromkeys dedupes without reordering
+    symbols = list(dict.fromkeys(
+        symbol for line in lines if (symbol := line.strip()) and not symbol.startswith("#")
+    ))
 
-    return symbols
+    _watchlist_cache[file_path] = (signature, symbols)
+    return list(symbols)
 
 
 def get_ipo_watchlist() -> List[str]:
     """Load ticker symbols from ipoWatchList.txt."""
-    watchlist_path = os.environ.get("IPO_WATCHLIST_FILE", IPO_WATCHLIST_FILE)
-    return _read_watchlist_file(Path(watchlist_path))
+    return _read_watchlist_file(_env_path("IPO_WATCHLIST_FILE", IPO_WATCHLIST_FILE))
 
 
 def get_volatility_watchlist() -> List[str]:
     """Load ticker symbols from volatilityWatchList.txt."""
-    watchlist_path = os.environ.get("VOLATILITY_WATCHLIST_FILE", VOLATILITY_WATCHLIST_FILE)
-    return _read_watchlist_file(Path(watchlist_path))
+    return _read_watchlist_file(_env_path("VOLATILITY_WATCHLIST_FILE", VOLATILITY_WATCHLIST_FILE))
 
 
-@dataclass
+@dataclass(slots=True)
 class UpcomingIPOEntry:
     """Entry from upcoming IPO watchlist file."""
 
@@ -149,46 +202,83 @@ class UpcomingIPOEntry:
     price_range: Optional[str] = None
 
 
+def _column_value(parts: List[str], index: int) -> Optional[str]:
+    """Get a column from a split watchlist row, or None if missing, empty or "-"."""
+    value = parts[index] if index < len(parts) else ""
+    return value if value and value != "-" else None
+
+
+def _split_columns(line: str, col_offsets: Optional[List[int]]) -> List[str]:
+    """Split an upcoming IPO watchlist row into its columns.
+
+    Rows that line up with the header's column offsets (as generated files
+    do) are sliced at those offsets; anything else is split on runs of 2+
+    spaces.
+    """
+    if col_offsets and not line[:1].isspace() and all(
+        line[offset - 2:offset] == "  " for offset in col_offsets[1:] if offset < len(line)
+    ):
+        bounds = zip(col_offsets, col_offsets[1:] + [len(line)])
+        return [line[start:end].strip() for start, end in bounds if start < len(line)]
+
+    return _COL_SPLIT_RE.split(line.strip())
+
+
 def get_upcoming_ipo_watchlist() -> List[UpcomingIPOEntry]:
     """Load upcoming IPO symbols from upcomingIPOList.txt.
 
     Format: Space-aligned columns (SYMBOL  DATE  COMPANY  PRICE_RANGE  SOURCE)
 
+    Parsed results are cached and only re-read when the file's mtime or
+    size changes.
+
     Returns:
         List of UpcomingIPOEntry objects
     """
-    import re
-
-    watchlist_path = os.environ.get("UPCOMING_IPO_WATCHLIST_FILE", UPCOMING_IPO_WATCHLIST_FILE)
-    watchlist_path = Path(watchlist_path)
+    watchlist_path = _env_path("UPCOMING_IPO_WATCHLIST_FILE", UPCOMING_IPO_WATCHLIST_FILE)
 
-    if not watchlist_path.exists():
+    try:
+        signature = _file_signature(watchlist_path)
+    except FileNotFoundError:
         return []
 
+    cached = _watchlist_cache.get(watchlist_path)
+    if cached and cached[0] == signature:
+        return list(cached[1])
+
+    entries = _parse_upcoming_ipo_file(watchlist_path)
+    _watchlist_cache[watchlist_path] = (signature, entries)
+    return list(entries)
+
+
+def _parse_upcoming_ipo_file(watchlist_path: Path) -> List[UpcomingIPOEntry]:
+    """Parse the space-aligned upcoming IPO watchlist file."""
     entries = []
+    col_offsets: Optional[List[int]] = None
     with open(watchlist_path, "r") as f:
         for line in f:
-            line = line.strip()
-            # Skip empty lines, comments, header row, and separator
-            if not line or line.startswith("#") or line.startswith("SYMBOL") or line.startswith("-"):
+            # Skip comments, header row and separator before doing any work
+            # (the generated file writes them at the start of the line)
+            if line.startswith(_NON_ENTRY_PREFIXES):
+                if line.startswith("SYMBOL"):
+                    col_offsets = [match.start() for match in _COL_NAME_RE.finditer(line)]
+                continue
+            line = line.rstrip("\n")
+            stripped = line.strip()
+            # Skip empty lines and indented comments, header row, and separator
+            if not stripped or stripped.startswith(_NON_ENTRY_PREFIXES):
                 continue
 
-            # Parse space-separated columns (split by 2+ spaces)
-            parts = re.split(r'\s{2,}', line)
+            parts = _split_columns(line, col_offsets)
             if not parts:
                 continue
 
-            symbol = parts[0].strip().upper()
-            entry = UpcomingIPOEntry(symbol=symbol)
-
-            if len(parts) > 1 and parts[1].strip() and parts[1].strip() != "-":
-                entry.expected_date = parts[1].strip()
-            if len(parts) > 2 and parts[2].strip() and parts[2].strip() != "-":
-                entry.company_name = parts[2].strip()
-            if len(parts) > 3 and parts[3].strip() and parts[3].strip() != "-":
-                entry.price_range = parts[3].strip()
-
-            entries.append(entry)
+            entries.append(UpcomingIPOEntry(
+                symbol=parts[0].upper(),
+                expected_date=_column_value(parts, 1),
+                company_name=_column_value(parts, 2),
+                price_range=_column_value(parts, 3),
+            ))
 
     return entries
 
@@ -197,6 +287,79 @@ def get_upcoming_ipo_watchlist() -> List[UpcomingIPOEntry]:
 ALERT_DAYS_BEFORE = 2  # Send alert this many days before IPO
 MAX_DAYS_AHEAD = 7     # Only keep IPOs within this many days
 
+# Cache of the merged IPO calendar data, reused for this many hours before refetching
+UPCOMING_IPO_CACHE_FILE = Path(__file__).parent.parent / "upcoming_ipo_cache.json"
+UPCOMING_IPO_CACHE_HOURS = 6
+
+
+@contextmanager
+def _atomic_write(file_path: Path) -> Iterator[TextIO]:
+    """Open a file for writing that only replaces file_path once fully written.
+
+    Content goes to a temporary file next to the target, which is renamed
+    over it when the block completes, so a crash mid-write never leaves a
+    truncated watchlist behind.
+    """
+    tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            yield f
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_if_changed(file_path: Path, content: str) -> bool:
+    """Atomically write a generated file unless its content is unchanged.
+
+    The "# Last updated:" timestamp line is ignored when comparing, so a
+    run that produces the same entries leaves the file untouched.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        existing = file_path.read_text()
+    except IOError:
+        existing = None
+
+    if existing is not None and _TIMESTAMP_LINE_RE.sub("", existing) == _TIMESTAMP_LINE_RE.sub("", content):
+        return False
+
+    with _atomic_write(file_path) as f:
+        f.write(content)
+    return True
+
+
+def parse_watchlist_date(date_str: str) -> Optional[date]:
+    """Parse a watchlist date in any of the accepted formats.
+
+    Returns:
+        The parsed date, or None if the string is not a valid date
+    """
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return None
+
+    groups = match.groups()
+    if groups[0]:
+        year, month, day = groups[0:3]
+    elif groups[3]:
+        year, month, day = groups[3:6]
+    else:
+        month, day, year = groups[6:9]
+
+    year_num = int(year)
+    if len(year) == 2:
+        # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+        year_num += 1900 if year_num >= 69 else 2000
+
+    try:
+        return date(year_num, int(month), int(day))
+    except ValueError:
+        return None
+
 
 def cleanup_upcoming_ipo_watchlist() -> int:
     """Remove past IPOs and IPOs more than MAX_DAYS_AHEAD days away.
@@ -204,69 +367,68 @@ def cleanup_upcoming_ipo_watchlist() -> int:
     Returns:
         Number of entries removed
     """
-    watchlist_path = os.environ.get("UPCOMING_IPO_WATCHLIST_FILE", UPCOMING_IPO_WATCHLIST_FILE)
-    watchlist_path = Path(watchlist_path)
+    watchlist_path = _env_path("UPCOMING_IPO_WATCHLIST_FILE", UPCOMING_IPO_WATCHLIST_FILE)
 
     if not watchlist_path.exists():
         return 0
 
     today = datetime.now().date()
-    lines_to_keep = []
     removed_count = 0
 
-    with open(watchlist_path, "r") as f:
-        for line in f:
-            original_line = line
-            line = line.strip()
-
-            # Keep comments and empty lines
-            if not line or line.startswith("#"):
-                lines_to_keep.append(original_line)
-                continue
+    # Stream kept lines straight into a temp file; it only replaces the
+    # watchlist if entries were removed
+    tmp_path = watchlist_path.with_suffix(watchlist_path.suffix + ".tmp")
+    try:
+        with open(watchlist_path, "r") as f, open(tmp_path, "w") as out:
+            for line in f:
+                original_line = line
 
-            # Parse the date from the entry
-            parts = line.split(":")
-            symbol = parts[0].strip().upper()
+                # Keep comments and empty lines (checked on the raw line first)
+                if line.startswith("#") or line.isspace():
+                    out.write(original_line)
+                    continue
 
-            # If no date provided, keep the entry
-            if len(parts) < 2 or not parts[1].strip():
-                lines_to_keep.append(original_line)
-                continue
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    out.write(original_line)
+                    continue
 
-            date_str = parts[1].strip()
+                # Parse the date from the entry
+                parts = line.split(":")
+                symbol = parts[0].strip().upper()
 
-            # Try to parse the date
-            ipo_date = None
-            for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%Y/%m/%d"]:
-                try:
-                    ipo_date = datetime.strptime(date_str, fmt).date()
-                    break
-                except ValueError:
+                # If no date provided, keep the entry
+                if len(parts) < 2 or not parts[1].strip():
+                    out.write(original_line)
                     continue
 
-            if ipo_date is None:
-                # Can't parse date, keep the entry
-                lines_to_keep.append(original_line)
-                continue
+                date_str = parts[1].strip()
 
-            # Calculate days until IPO
-            days_until = (ipo_date - today).days
+                ipo_date = parse_watchlist_date(date_str)
 
-            # Remove if date has passed (days_until < 0) or more than MAX_DAYS_AHEAD away
-            if days_until < 0:
-                logger.info(f"Removing {symbol}: IPO date {date_str} has passed")
-                removed_count += 1
-            elif days_until > MAX_DAYS_AHEAD:
-                logger.info(f"Removing {symbol}: IPO date {date_str} is more than {MAX_DAYS_AHEAD} days away ({days_until} days)")
-                removed_count += 1
-            else:
-                lines_to_keep.append(original_line)
+                if ipo_date is None:
+                    # Can't parse date, keep the entry
+                    out.write(original_line)
+                    continue
 
-    # Only rewrite the file if entries were removed
-    if removed_count > 0:
-        with open(watchlist_path, "w") as f:
-            f.writelines(lines_to_keep)
-        logger.info(f"Cleaned up {removed_count} entries from upcoming IPO watchlist")
+                # Calculate days until IPO
+                days_until = (ipo_date - today).days
+
+                # Remove if date has passed (days_until < 0) or more than MAX_DAYS_AHEAD away
+                if days_until < 0:
+                    logger.info("Removing %s: IPO date %s has passed", symbol, date_str)
+                    removed_count += 1
+                elif days_until > MAX_DAYS_AHEAD:
+                    logger.info("Removing %s: IPO date %s is more than %s days away (%s days)", symbol, date_str, MAX_DAYS_AHEAD, days_until)
+                    removed_count += 1
+                else:
+                    out.write(original_line)
+
+        if removed_count > 0:
+            os.replace(tmp_path, watchlist_path)
+            logger.info("Cleaned up %s entries from upcoming IPO watchlist", removed_count)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
     return removed_count
 
@@ -285,37 +447,39 @@ def refresh_upcoming_ipo_watchlist() -> int:
     # Import here to avoid circular imports
     from .ipo_data_sources import fetch_upcoming_ipos
 
-    watchlist_path = os.environ.get("UPCOMING_IPO_WATCHLIST_FILE", UPCOMING_IPO_WATCHLIST_FILE)
-    watchlist_path = Path(watchlist_path)
+    watchlist_path = _env_path("UPCOMING_IPO_WATCHLIST_FILE", UPCOMING_IPO_WATCHLIST_FILE)
+
+    cache_file = _env_path("UPCOMING_IPO_CACHE_FILE", UPCOMING_IPO_CACHE_FILE)
 
     logger.info("Fetching upcoming IPOs from multiple sources...")
-    valid_ipos = fetch_upcoming_ipos(max_days_ahead=MAX_DAYS_AHEAD)
+    valid_ipos = fetch_upcoming_ipos(
+        max_days_ahead=MAX_DAYS_AHEAD,
+        cache_file=cache_file,
+        max_age=timedelta(hours=UPCOMING_IPO_CACHE_HOURS),
+    )
 
     # Write the watchlist file (properly aligned tabular format)
     sources_list = "NASDAQ, Yahoo Finance, IPOScoop, MarketWatch"
 
-    # Prepare data rows
-    rows = []
-    for ipo in valid_ipos:
-        rows.append({
-            "symbol": ipo.symbol,
-            "date": ipo.format_date(),
-            "company": ipo.company_name or "-",
-            "price_range": ipo.price_range or "-",
-            "source": ", ".join(ipo.sources),
-        })
-
-    # Calculate column widths (minimum widths for headers)
-    col_widths = {
-        "symbol": max(6, max((len(r["symbol"]) for r in rows), default=0)),
-        "date": max(10, max((len(r["date"]) for r in rows), default=0)),
-        "company": max(7, max((len(r["company"]) for r in rows), default=0)),
-        "price_range": max(11, max((len(r["price_range"]) for r in rows), default=0)),
-        "source": max(6, max((len(r["source"]) for r in rows), default=0)),
-    }
+    # Prepare data rows (SYMBOL, DATE, COMPANY, PRICE_RANGE, SOURCE)
+    rows = [
+        (
+            ipo.symbol,
+            ipo.format_date(),
+            ipo.company_name or "-",
+            ipo.price_range or "-",
+            ", ".join(sorted(ipo.sources)),
+        )
+        for ipo in valid_ipos
+    ]
+
+    # Calculate column widths in a single pass (minimum widths for headers)
+    col_widths = [6, 10, 7, 11, 6]
+    for row in rows:
+        col_widths = [max(width, len(value)) for width, value in zip(col_widths, row)]
 
     # Create format string
-    fmt = f"{{:<{col_widths['symbol']}}}  {{:<{col_widths['date']}}}  {{:<{col_widths['company']}}}  {{:<{col_widths['price_range']}}}  {{:<{col_widths['source']}}}"
+    fmt = "  ".join(f"{{:<{width}}}" for width in col_widths)
 
     # Build header row and separator
     header_row = fmt.format("SYMBOL", "DATE", "COMPANY", "PRICE_RANGE", "SOURCE")
@@ -333,13 +497,11 @@ def refresh_upcoming_ipo_watchlist() -> int:
 {separator}
 """
 
-    with open(watchlist_path, "w") as f:
-        f.write(header)
-        for row in rows:
-            line = fmt.format(row["symbol"], row["date"], row["company"], row["price_range"], row["source"])
-            f.write(f"{line}\n")
-
-    logger.info(f"Updated upcoming IPO watchlist with {len(valid_ipos)} IPOs")
+    content = header + "".join(fmt.format(*row) + "\n" for row in rows)
+    if _write_if_changed(watchlist_path, content):
+        logger.info("Updated upcoming IPO watchlist with %s IPOs", len(valid_ipos))
+    else:
+        logger.info("Upcoming IPO watchlist unchanged (%s IPOs) - skipping write", len(valid_ipos))
 
     # Also update the IPO watchlist with tickers from upcoming IPOs
     sync_ipo_watchlist_from_upcoming(valid_ipos)
@@ -349,6 +511,7 @@ def refresh_upcoming_ipo_watchlist() -> int:
 
 # Days after IPO to keep ticker in watchlist (to catch trading start)
 DAYS_AFTER_IPO_TO_KEEP = 2
+_KEEP_DELTA = timedelta(days=DAYS_AFTER_IPO_TO_KEEP)
 
 # State file for tracking IPO dates for watchlist cleanup
 IPO_WATCHLIST_DATES_FILE = Path(__file__).parent.parent / "ipo_watchlist_dates.json"
@@ -364,22 +527,18 @@ def sync_ipo_watchlist_from_upcoming(upcoming_ipos: list) -> int:
     Returns:
         Number of tickers in the updated watchlist
     """
-    import json
-
-    watchlist_path = os.environ.get("IPO_WATCHLIST_FILE", IPO_WATCHLIST_FILE)
-    watchlist_path = Path(watchlist_path)
-    dates_file = Path(os.environ.get("IPO_WATCHLIST_DATES_FILE", IPO_WATCHLIST_DATES_FILE))
+    watchlist_path = _env_path("IPO_WATCHLIST_FILE", IPO_WATCHLIST_FILE)
+    dates_file = _env_path("IPO_WATCHLIST_DATES_FILE", IPO_WATCHLIST_DATES_FILE)
 
     today = datetime.now().date()
 
     # Load existing IPO dates tracking
     ipo_dates = {}
-    if dates_file.exists():
-        try:
-            with open(dates_file, "r") as f:
-                ipo_dates = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
+    try:
+        ipo_dates = json.loads(dates_file.read_bytes())
+    except (json.JSONDecodeError, IOError):
+        # Missing or unreadable file - start tracking from scratch
+        pass
 
     # Add new IPOs from upcoming list
     for ipo in upcoming_ipos:
@@ -387,32 +546,34 @@ def sync_ipo_watchlist_from_upcoming(upcoming_ipos: list) -> int:
         if ipo.expected_date:
             date_str = ipo.expected_date.strftime("%Y-%m-%d")
             if symbol not in ipo_dates:
-                logger.info(f"Adding {symbol} to IPO watchlist (IPO date: {date_str})")
+                logger.info("Adding %s to IPO watchlist (IPO date: %s)", symbol, date_str)
             ipo_dates[symbol] = date_str
 
-    # Determine which tickers to keep
-    tickers_to_keep = []
-    tickers_to_remove = []
+    # Determine which tickers to keep (IPOs before this date are past the cutoff)
+    cutoff_threshold = today - _KEEP_DELTA
+    cutoff_str = cutoff_threshold.strftime("%Y-%m-%d")
+    kept_dates = {}
+
+    for symbol, date_str in ipo_dates.items():
+        # YYYY-MM-DD strings sort chronologically, so only dates that may be
+        # past the cutoff need to be parsed
+        if date_str >= cutoff_str:
+            kept_dates[symbol] = date_str
+            continue
 
-    for symbol, date_str in list(ipo_dates.items()):
         try:
             ipo_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            cutoff_date = ipo_date + timedelta(days=DAYS_AFTER_IPO_TO_KEEP)
-            days_since_cutoff = (today - cutoff_date).days
-
-            if days_since_cutoff > 0:
-                # Past cutoff, remove
-                logger.info(f"Removing {symbol} from IPO watchlist (IPO was on {date_str}, {days_since_cutoff} days past cutoff)")
-                tickers_to_remove.append(symbol)
-            else:
-                tickers_to_keep.append(symbol)
         except ValueError:
             # Can't parse date, keep it
-            tickers_to_keep.append(symbol)
+            kept_dates[symbol] = date_str
+            continue
 
-    # Remove expired tickers from dates tracking
-    for symbol in tickers_to_remove:
-        del ipo_dates[symbol]
+        if ipo_date < cutoff_threshold:
+            # Past cutoff, remove
+            days_since_cutoff = (cutoff_threshold - ipo_date).days
+            logger.info("Removing %s from IPO watchlist (IPO was on %s, %s days past cutoff)", symbol, date_str, days_since_cutoff)
+        else:
+            kept_dates[symbol] = date_str
 
     # Write updated ipoWatchList.txt
     header = f"""# IPO Watchlist (Auto-generated from upcoming IPOs)
@@ -423,14 +584,12 @@ def sync_ipo_watchlist_from_upcoming(upcoming_ipos: list) -> int:
 
 """
 
-    with open(watchlist_path, "w") as f:
-        f.write(header)
-        for symbol in sorted(tickers_to_keep):
-            f.write(f"{symbol}\n")
+    if _write_if_changed(watchlist_path, header + "".join(f"{symbol}\n" for symbol in sorted(kept_dates))):
+        _watchlist_cache.pop(watchlist_path, None)
 
     # Save updated dates tracking
-    with open(dates_file, "w") as f:
-        json.dump(ipo_dates, f, indent=2)
+    # Serialize in one go and write once (json.dump writes chunk by chunk)
+    _write_if_changed(dates_file, json.dumps(kept_dates, indent=2))
 
-    logger.info(f"Updated IPO watchlist with {len(tickers_to_keep)} tickers")
-    return len(tickers_to_keep)
+    logger.info("Updated IPO watchlist with %s tickers", len(kept_dates))
+    return len(kept_dates)
@@ -0,0 +1,143 @@
+"""Shared HTTP session for all outbound requests."""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Connection pool sizing (pool_maxsize should cover the concurrent checks in main.py)
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# (connect, read) timeout in seconds for data-source requests, so one hung
+# server can't stall a check indefinitely
+HTTP_TIMEOUT = (3.05, 10)
+
+# How long get_json reuses a fetched document by default (seconds)
+JSON_CACHE_TTL = 300
+
+# Longest Retry-After (seconds) honoured before retrying a rate-limited request,
+# so one large value can't stall a worker thread for minutes
+MAX_RETRY_AFTER = 10
+
+# Telegram's own 429 handling lives in TelegramNotifier, so its host gets an
+# adapter without 429 in the retried statuses
+TELEGRAM_API_PREFIX = "https://api.telegram.org/"
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Recent get_json responses: url -> (monotonic time fetched, decoded JSON,
+# conditional request headers to revalidate it with once it expires)
+_json_cache: Dict[str, Tuple[float, Any, Dict[str, str]]] = {}
+_json_url_locks: Dict[str, threading.Lock] = {}
+
+
+class _CappedRetry(Retry):
+    """Retry policy that waits at most MAX_RETRY_AFTER seconds for Retry-After."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+def _make_adapter(status_forcelist: List[int]) -> HTTPAdapter:
+    """Create a pooled adapter that retries transient errors with backoff."""
+    retry = _CappedRetry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=status_forcelist,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+def _create_session() -> requests.Session:
+    """Create a session with connection pooling and retries on transient errors."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+
+    adapter = _make_adapter([429, 500, 502, 503, 504])
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.mount(TELEGRAM_API_PREFIX, _make_adapter([500, 502, 503, 504]))
+    return session
+
+
+def get_session() -> requests.Session:
+    """Get the process-wide HTTP session (created on first use).
+
+    Reusing one session keeps connections alive across checks, so each host
+    only pays the TCP + TLS handshake once per run.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+
+def get_json(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    ttl: float = JSON_CACHE_TTL,
+    session: Optional[requests.Session] = None,
+) -> Optional[Any]:
+    """Get a JSON document, reusing a recent response for the same URL.
+
+    Several modules read the same feed (e.g. the NASDAQ IPO calendar) in one
+    run, so each URL is fetched at most once per ttl seconds, even by
+    concurrent callers. After that the cached copy is revalidated with the
+    server's ETag/Last-Modified, so an unchanged document isn't downloaded
+    again. Unsuccessful responses are not cached. The returned document is
+    shared between callers and must not be modified.
+
+    Returns:
+        The decoded JSON, or None if the server didn't respond with 200
+
+    Raises:
+        requests.RequestException: If the request failed
+    """
+    with _session_lock:
+        url_lock = _json_url_locks.setdefault(url, threading.Lock())
+
+    with url_lock:
+        cached = _json_cache.get(url)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        request_headers = dict(headers or {})
+        if cached:
+            request_headers.update(cached[2])
+
+        response = (session or get_session()).get(url, headers=request_headers, timeout=HTTP_TIMEOUT)
+        if response.status_code == 304 and cached:
+            _json_cache[url] = (time.monotonic(), cached[1], cached[2])
+            return cached[1]
+        if response.status_code != 200:
+            return None
+
+        data = response.json()
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        _json_cache[url] = (time.monotonic(), data, validators)
+        return data
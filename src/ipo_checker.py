@@ -1,12 +1,16 @@
 """IPO status checking module."""
 
 import logging
+import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import requests
 
+from .http_client import HTTP_TIMEOUT, USER_AGENT, get_json, get_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +27,19 @@ class IPOStatus(Enum):
     TRADING = "trading"
 
 
-@dataclass
+# Statuses in which shares can be traded
+_TRADEABLE_STATUSES = frozenset((IPOStatus.LISTED, IPOStatus.TRADING))
+
+# Statuses that are actionable updates (subscription or trading)
+_ACTIONABLE_STATUSES = frozenset((
+    IPOStatus.SUBSCRIPTION_OPEN,
+    IPOStatus.ALLOTMENT_DONE,
+    IPOStatus.LISTED,
+    IPOStatus.TRADING,
+))
+
+
+@dataclass(slots=True)
 class IPOInfo:
     """IPO information data class."""
 
@@ -37,30 +53,87 @@ class IPOInfo:
 
     def is_tradeable(self) -> bool:
         """Check if shares are available for trading."""
-        return self.status in (IPOStatus.LISTED, IPOStatus.TRADING)
+        return self.status in _TRADEABLE_STATUSES
 
     def is_actionable(self) -> bool:
         """Check if there's an actionable update (subscription or trading)."""
-        return self.status in (
-            IPOStatus.SUBSCRIPTION_OPEN,
-            IPOStatus.ALLOTMENT_DONE,
-            IPOStatus.LISTED,
-            IPOStatus.TRADING,
-        )
+        return self.status in _ACTIONABLE_STATUSES
+
+
+NASDAQ_CALENDAR_URL = "https://api.nasdaq.com/api/ipo/calendar"
+
+# How long a fetched NASDAQ IPO calendar is reused before fetching it again (seconds)
+NASDAQ_CALENDAR_TTL = 300
+
+# NASDAQ IPO calendar sections (in search order) and the status each one implies
+_SECTION_STATUS = {
+    "upcoming": IPOStatus.SUBSCRIPTION_OPEN,
+    "priced": IPOStatus.SUBSCRIPTION_CLOSED,
+    "filed": IPOStatus.UPCOMING,
+}
+
+# Request headers for the NASDAQ calendar API
+_NASDAQ_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/json",
+}
+
+# NASDAQ IPO calendar rows indexed by ticker: symbol -> (section, row),
+# along with the calendar document the index was built from
+_nasdaq_calendar: Dict[str, Tuple[str, dict]] = {}
+_nasdaq_calendar_source: Optional[dict] = None
+_nasdaq_calendar_lock = threading.Lock()
+
+
+def _get_nasdaq_calendar_index(session: requests.Session, headers: Dict[str, str]) -> Dict[str, Tuple[str, dict]]:
+    """Get the NASDAQ IPO calendar indexed by ticker symbol.
+
+    The calendar is the same for every symbol, so it is fetched once per
+    NASDAQ_CALENDAR_TTL seconds (shared with the other modules reading it)
+    and only re-indexed when a new copy is fetched.
+
+    Raises:
+        requests.RequestException: If the calendar could not be fetched
+    """
+    global _nasdaq_calendar, _nasdaq_calendar_source
+
+    calendar = get_json(NASDAQ_CALENDAR_URL, headers=headers, ttl=NASDAQ_CALENDAR_TTL, session=session)
+    if calendar is None:
+        return {}
+
+    with _nasdaq_calendar_lock:
+        if calendar is _nasdaq_calendar_source:
+            return _nasdaq_calendar
+
+        data = calendar.get("data") or {}
+        index: Dict[str, Tuple[str, dict]] = {}
+
+        # Search in upcoming, priced, and filed sections (first match wins)
+        for section in _SECTION_STATUS:
+            rows = (data.get(section) or {}).get("rows") or []
+            for row in rows:
+                symbol = (row.get("proposedTickerSymbol") or "").upper()
+                if symbol and symbol not in index:
+                    index[symbol] = (section, row)
+
+        _nasdaq_calendar = index
+        _nasdaq_calendar_source = calendar
+        return index
+
+
+# How long a Yahoo Finance result is reused for repeat checks of a symbol (seconds)
+YAHOO_RESULT_TTL = 30.0
+
+# Recent Yahoo Finance results: symbol -> (monotonic time fetched, result)
+_yahoo_results: Dict[str, Tuple[float, IPOInfo]] = {}
 
 
 class IPOChecker:
     """Check IPO status from multiple sources."""
 
-    USER_AGENT = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-
-    def __init__(self, symbol: str):
+    def __init__(self, symbol: str, session: Optional[requests.Session] = None):
         self.symbol = symbol.upper()
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.USER_AGENT})
+        self.session = session or get_session()
 
     def check_status(self) -> IPOInfo:
         """Check IPO status from multiple sources."""
@@ -78,12 +151,28 @@ class IPOChecker:
         return IPOInfo(symbol=self.symbol, status=IPOStatus.NOT_FOUND)
 
     def _check_yahoo_finance_api(self) -> Optional[IPOInfo]:
-        """Check Yahoo Finance API for stock data."""
+        """Check Yahoo Finance API for stock data.
+
+        Results are reused for YAHOO_RESULT_TTL seconds, so repeat checks of
+        the same symbol in quick succession don't hit the API again.
+        """
+        cached = _yahoo_results.get(self.symbol)
+        if cached and time.monotonic() - cached[0] < YAHOO_RESULT_TTL:
+            return cached[1]
+
+        info = self._fetch_yahoo_finance_api()
+        # Failed requests (None) are not cached so the next check retries
+        if info is not None:
+            _yahoo_results[self.symbol] = (time.monotonic(), info)
+        return info
+
+    def _fetch_yahoo_finance_api(self) -> Optional[IPOInfo]:
+        """Fetch stock data for the symbol from the Yahoo Finance API."""
         try:
             # Use Yahoo Finance quote API
             url = f"https://query1.finance.yahoo.com/v8/finance/chart/{self.symbol}"
             params = {"interval": "1d", "range": "1d"}
-            response = self.session.get(url, params=params, timeout=15)
+            response = self.session.get(url, params=params, timeout=HTTP_TIMEOUT)
 
             if response.status_code == 200:
                 data = response.json()
@@ -112,68 +201,49 @@ class IPOChecker:
                             details=f"Trading on {exchange} at {currency} {price:.2f}",
                         )
 
-            # Check error response
-            if response.status_code == 404:
-                return IPOInfo(symbol=self.symbol, status=IPOStatus.NOT_FOUND)
-
-            # Try to parse error from response
-            try:
-                data = response.json()
-                error = data.get("chart", {}).get("error")
-                if error and "No data found" in str(error):
-                    return IPOInfo(symbol=self.symbol, status=IPOStatus.NOT_FOUND)
-            except Exception:
-                pass
-
+            # Any other response (404, "No data found" errors, ...) means not found
             return IPOInfo(symbol=self.symbol, status=IPOStatus.NOT_FOUND)
 
         except requests.RequestException as e:
-            logger.warning(f"Yahoo Finance API check failed: {e}")
+            logger.warning("Yahoo Finance API check failed: %s", e)
             return None
 
     def _check_nasdaq_ipo_calendar(self) -> Optional[IPOInfo]:
         """Check NASDAQ IPO calendar for upcoming/recent IPOs."""
         try:
-            url = "https://api.nasdaq.com/api/ipo/calendar"
-            headers = {
-                "User-Agent": self.USER_AGENT,
-                "Accept": "application/json",
-            }
-            response = self.session.get(url, headers=headers, timeout=15)
+            calendar = _get_nasdaq_calendar_index(self.session, _NASDAQ_HEADERS)
+        except requests.RequestException as e:
+            logger.warning("NASDAQ calendar check failed: %s", e)
+            return None
 
-            if response.status_code == 200:
-                data = response.json()
+        found = calendar.get(self.symbol)
+        if not found:
+            return IPOInfo(symbol=self.symbol, status=IPOStatus.NOT_FOUND)
 
-                # Search in upcoming, priced, and filed sections
-                for section in ["upcoming", "priced", "filed"]:
-                    rows = data.get("data", {}).get(section, {}).get("rows", []) or []
-                    for row in rows:
-                        symbol = (row.get("proposedTickerSymbol") or "").upper()
-                        if symbol == self.symbol:
-                            company_name = row.get("companyName")
-                            expected_date = row.get("expectedPriceDate") or row.get("pricedDate")
-
-                            if section == "priced":
-                                status = IPOStatus.SUBSCRIPTION_CLOSED
-                            elif section == "upcoming":
-                                status = IPOStatus.SUBSCRIPTION_OPEN
-                            else:
-                                status = IPOStatus.UPCOMING
-
-                            return IPOInfo(
-                                symbol=self.symbol,
-                                status=status,
-                                company_name=company_name,
-                                exchange="NASDAQ",
-                                listing_date=expected_date,
-                                details=f"Found in NASDAQ {section} IPOs",
-                            )
+        section, row = found
+        company_name = row.get("companyName")
+        expected_date = row.get("expectedPriceDate") or row.get("pricedDate")
+
+        return IPOInfo(
+            symbol=self.symbol,
+            status=_SECTION_STATUS[section],
+            company_name=company_name,
+            exchange="NASDAQ",
+            listing_date=expected_date,
+            details=f"Found in NASDAQ {section} IPOs",
+        )
 
-            return IPOInfo(symbol=self.symbol, status=IPOStatus.NOT_FOUND)
 
-        except requests.RequestException as e:
-            logger.warning(f"NASDAQ calendar check failed: {e}")
-            return None
+def prefetch_nasdaq_calendar() -> None:
+    """Fetch and index the NASDAQ IPO calendar ahead of the symbol checks.
+
+    Run alongside the Yahoo Finance checks, so symbols that fall through to
+    the calendar find it already cached instead of waiting for the download.
+    """
+    try:
+        _get_nasdaq_calendar_index(get_session(), _NASDAQ_HEADERS)
+    except requests.RequestException as e:
+        logger.warning("NASDAQ calendar prefetch failed: %s", e)
 
 
 def check_ipo_status(symbol: str) -> IPOInfo:
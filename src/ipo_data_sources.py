@@ -8,20 +8,86 @@ Aggregates upcoming IPO data from multiple sources:
 - Webull
 """
 
+import json
 import logging
+import os
 import re
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Optional, Set
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .http_client import HTTP_TIMEOUT, USER_AGENT, get_json, get_session
+from .ipo_checker import NASDAQ_CALENDAR_TTL, NASDAQ_CALENDAR_URL
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-based lxml parser when installed, it's much faster on large pages
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Only the calendar tables are read from scraped pages, so skip building the rest of the DOM
+_ONLY_TABLES = SoupStrainer("table")
+_ONLY_MARKETWATCH_TABLE = SoupStrainer("table", class_="table--primary")
+
+
+# Date formats seen across the sources, keyed by the shape of the string, so
+# only the formats that can match are tried with strptime
+_DATE_DISPATCH = [
+    (re.compile(r"\d{4}-\d{1,2}-\d{1,2}"), ("%Y-%m-%d",)),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), ("%m/%d/%Y",)),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{2}"), ("%m/%d/%y",)),
+    (re.compile(r"\d{4}/\d{1,2}/\d{1,2}"), ("%Y/%m/%d",)),
+    (re.compile(r"[A-Za-z]+\s+\d{1,2},\s*\d{4}"), ("%b %d, %Y", "%B %d, %Y")),
+    (re.compile(r"\d{1,2}\s+[A-Za-z]+\s+\d{4}"), ("%d %b %Y", "%d %B %Y")),
+]
+
+# Strings like "Jan 22" (no year, assume current year)
+_MONTH_DAY_RE = re.compile(r"[A-Za-z]+\s+\d{1,2}")
+
+# Patterns picked out of IPOScoop calendar rows
+_TICKER_RE = re.compile(r"\b([A-Z]{2,5})\b")
+_SLASH_DATE_RE = re.compile(r"(\d{1,2}/\d{1,2}/\d{2,4})")
+_PRICE_RANGE_RE = re.compile(r"\$[\d.]+-\$[\d.]+|\$[\d.]+")
+
+# Uppercase words in IPOScoop rows that look like tickers but aren't
+_NON_TICKER_WORDS = frozenset((
+    "IPO", "CEO", "USA", "US", "LLC", "INC", "LTD", "CORP", "PLC", "NV", "SA", "AG",
+    "NYSE", "AMEX", "ETF", "SPAC", "ADR", "ADS", "USD", "TBA", "TBD", "NA",
+))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(date_str: str) -> Optional[datetime]:
+    """Parse a stripped date string in any of the known formats with a year.
+
+    Rows from the same source often repeat the same date string, so results
+    are cached. Strings without a year are handled by the caller, since
+    their result depends on the current year.
+    """
+    for pattern, formats in _DATE_DISPATCH:
+        if pattern.fullmatch(date_str):
+            for fmt in formats:
+                try:
+                    return datetime.strptime(date_str, fmt)
+                except ValueError:
+                    continue
+            return None
+
+    return None
 
-@dataclass
+
+@dataclass(slots=True)
 class IPOData:
     """Unified IPO data from any source."""
     symbol: str
@@ -33,38 +99,67 @@ class IPOData:
     sources: Set[str] = field(default_factory=set)
 
     def days_until(self, today: datetime.date = None) -> Optional[int]:
+        if not self.expected_date:
+            return None
         if today is None:
             today = datetime.now().date()
-        if self.expected_date:
-            return (self.expected_date.date() - today).days
-        return None
+        return self.expected_date.toordinal() - today.toordinal()
 
     def format_date(self) -> str:
         if self.expected_date:
-            return self.expected_date.strftime("%Y-%m-%d")
+            return self.expected_date.date().isoformat()
         return "TBD"
 
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "symbol": self.symbol,
+            "company_name": self.company_name,
+            "expected_date": self.expected_date.strftime("%Y-%m-%d") if self.expected_date else None,
+            "price_range": self.price_range,
+            "exchange": self.exchange,
+            "shares": self.shares,
+            "sources": sorted(self.sources),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IPOData":
+        """Deserialize from a dict produced by to_dict()."""
+        expected_date = data.get("expected_date")
+        return cls(
+            symbol=data["symbol"],
+            company_name=data.get("company_name"),
+            expected_date=datetime.strptime(expected_date, "%Y-%m-%d") if expected_date else None,
+            price_range=data.get("price_range"),
+            exchange=data.get("exchange"),
+            shares=data.get("shares"),
+            sources=set(data.get("sources", [])),
+        )
+
+
+# IPOData fields filled in from other sources when merging
+_MERGE_FIELDS = tuple(f.name for f in fields(IPOData) if f.name not in ("symbol", "sources"))
+
 
 class IPODataFetcher:
     """Fetch IPO data from multiple sources."""
 
-    USER_AGENT = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
-    )
-
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": self.USER_AGENT,
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or get_session()
+        # Sent per request so the shared session's defaults stay untouched
+        self.headers = {
+            "User-Agent": USER_AGENT,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-        })
+        }
 
     def fetch_all_sources(self, max_days_ahead: int = 7) -> List[IPOData]:
         """Fetch IPOs from all sources and return unified list."""
+        return filter_upcoming_ipos(self.fetch_merged(), max_days_ahead)
+
+    def fetch_merged(self) -> List[IPOData]:
+        """Fetch IPOs from all sources and merge them by symbol (no date filtering)."""
         all_ipos: Dict[str, IPOData] = {}
-        today = datetime.now().date()
 
         # Fetch from each source
         sources = [
@@ -74,26 +169,24 @@ class IPODataFetcher:
             ("MarketWatch", self._fetch_marketwatch),
         ]
 
-        for source_name, fetch_func in sources:
-            try:
-                logger.info(f"Fetching from {source_name}...")
-                ipos = fetch_func()
-                for ipo in ipos:
-                    self._merge_ipo(all_ipos, ipo, source_name)
-                logger.info(f"  Found {len(ipos)} IPOs from {source_name}")
-            except Exception as e:
-                logger.warning(f"  Failed to fetch from {source_name}: {e}")
-
-        # Filter by date range and return
-        valid_ipos = []
-        for symbol, ipo in all_ipos.items():
-            days = ipo.days_until(today)
-            if days is not None and 0 <= days <= max_days_ahead:
-                valid_ipos.append(ipo)
-                logger.info(f"  Valid: {ipo.symbol} ({ipo.company_name}) - {ipo.format_date()} ({days} days) [Sources: {', '.join(ipo.sources)}]")
-
-        logger.info(f"Total valid IPOs within {max_days_ahead} days: {len(valid_ipos)}")
-        return valid_ipos
+        # The sources are independent and network-bound, so fetch them all at once
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = []
+            for source_name, fetch_func in sources:
+                logger.info("Fetching from %s...", source_name)
+                futures.append((source_name, executor.submit(fetch_func)))
+
+            # Merge in source order, so earlier sources still take precedence
+            for source_name, future in futures:
+                try:
+                    ipos = future.result()
+                    for ipo in ipos:
+                        self._merge_ipo(all_ipos, ipo, source_name)
+                    logger.info("  Found %s IPOs from %s", len(ipos), source_name)
+                except Exception as e:
+                    logger.warning("  Failed to fetch from %s: %s", source_name, e)
+
+        return list(all_ipos.values())
 
     def _merge_ipo(self, all_ipos: Dict[str, IPOData], new_ipo: IPOData, source: str):
         """Merge IPO data, preferring more complete information."""
@@ -108,16 +201,10 @@ class IPODataFetcher:
         existing.sources.add(source)
 
         # Merge fields, preferring non-None values
-        if new_ipo.company_name and not existing.company_name:
-            existing.company_name = new_ipo.company_name
-        if new_ipo.expected_date and not existing.expected_date:
-            existing.expected_date = new_ipo.expected_date
-        if new_ipo.price_range and not existing.price_range:
-            existing.price_range = new_ipo.price_range
-        if new_ipo.exchange and not existing.exchange:
-            existing.exchange = new_ipo.exchange
-        if new_ipo.shares and not existing.shares:
-            existing.shares = new_ipo.shares
+        for name in _MERGE_FIELDS:
+            value = getattr(new_ipo, name)
+            if value and not getattr(existing, name):
+                setattr(existing, name, value)
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Try multiple date formats."""
@@ -125,29 +212,17 @@ class IPODataFetcher:
             return None
 
         date_str = date_str.strip()
-        formats = [
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-            "%m/%d/%y",
-            "%Y/%m/%d",
-            "%b %d, %Y",
-            "%B %d, %Y",
-            "%d %b %Y",
-            "%d %B %Y",
-        ]
+        parsed = _parse_date_str(date_str)
+        if parsed:
+            return parsed
 
-        for fmt in formats:
+        # Try to extract date from strings like "Jan 22" (assume current year)
+        if _MONTH_DAY_RE.fullmatch(date_str):
             try:
-                return datetime.strptime(date_str, fmt)
+                month_day = datetime.strptime(date_str, "%b %d")
+                return month_day.replace(year=datetime.now().year)
             except ValueError:
-                continue
-
-        # Try to extract date from strings like "Jan 22" (assume current year)
-        try:
-            month_day = datetime.strptime(date_str, "%b %d")
-            return month_day.replace(year=datetime.now().year)
-        except ValueError:
-            pass
+                pass
 
         return None
 
@@ -155,15 +230,13 @@ class IPODataFetcher:
         """Fetch from NASDAQ IPO Calendar API."""
         results = []
         try:
-            url = "https://api.nasdaq.com/api/ipo/calendar"
             headers = {
-                "User-Agent": self.USER_AGENT,
+                "User-Agent": USER_AGENT,
                 "Accept": "application/json",
             }
-            response = self.session.get(url, headers=headers, timeout=15)
+            data = get_json(NASDAQ_CALENDAR_URL, headers=headers, ttl=NASDAQ_CALENDAR_TTL, session=self.session)
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
 
                 for section in ["upcoming", "priced", "filed"]:
                     rows = data.get("data", {}).get(section, {}).get("rows", []) or []
@@ -185,7 +258,7 @@ class IPODataFetcher:
                         ))
 
         except requests.RequestException as e:
-            logger.warning(f"NASDAQ API error: {e}")
+            logger.warning("NASDAQ API error: %s", e)
 
         return results
 
@@ -195,10 +268,10 @@ class IPODataFetcher:
         try:
             # Yahoo Finance IPO calendar
             url = "https://finance.yahoo.com/calendar/ipo"
-            response = self.session.get(url, timeout=15)
+            response = self.session.get(url, headers=self.headers, timeout=HTTP_TIMEOUT)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_ONLY_TABLES)
 
                 # Find IPO table rows
                 table = soup.find("table")
@@ -223,7 +296,7 @@ class IPODataFetcher:
                                 ))
 
         except requests.RequestException as e:
-            logger.warning(f"Yahoo Finance error: {e}")
+            logger.warning("Yahoo Finance error: %s", e)
 
         return results
 
@@ -232,10 +305,10 @@ class IPODataFetcher:
         results = []
         try:
             url = "https://www.iposcoop.com/ipo-calendar/"
-            response = self.session.get(url, timeout=15)
+            response = self.session.get(url, headers=self.headers, timeout=HTTP_TIMEOUT)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_ONLY_TABLES)
 
                 # Find IPO entries
                 tables = soup.find_all("table")
@@ -248,18 +321,20 @@ class IPODataFetcher:
                             text = row.get_text(" ", strip=True)
 
                             # Look for ticker symbol pattern
-                            symbol_match = re.search(r'\b([A-Z]{2,5})\b', text)
-                            if symbol_match:
-                                symbol = symbol_match.group(1)
+                            symbol = next(
+                                (m.group(1) for m in _TICKER_RE.finditer(text) if m.group(1) not in _NON_TICKER_WORDS),
+                                None,
+                            )
+                            if symbol:
 
                                 # Try to find date
-                                date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{2,4})', text)
+                                date_match = _SLASH_DATE_RE.search(text)
                                 expected_date = None
                                 if date_match:
                                     expected_date = self._parse_date(date_match.group(1))
 
                                 # Try to find price range
-                                price_match = re.search(r'\$[\d.]+-\$[\d.]+|\$[\d.]+', text)
+                                price_match = _PRICE_RANGE_RE.search(text)
                                 price_range = price_match.group(0) if price_match else None
 
                                 # Get company name from first column
@@ -274,7 +349,7 @@ class IPODataFetcher:
                                     ))
 
         except requests.RequestException as e:
-            logger.warning(f"IPOScoop error: {e}")
+            logger.warning("IPOScoop error: %s", e)
 
         return results
 
@@ -283,10 +358,10 @@ class IPODataFetcher:
         results = []
         try:
             url = "https://www.marketwatch.com/tools/ipo-calendar"
-            response = self.session.get(url, timeout=15)
+            response = self.session.get(url, headers=self.headers, timeout=HTTP_TIMEOUT)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_ONLY_MARKETWATCH_TABLE)
 
                 # Find IPO table
                 table = soup.find("table", class_="table--primary")
@@ -309,12 +384,81 @@ class IPODataFetcher:
                                 ))
 
         except requests.RequestException as e:
-            logger.warning(f"MarketWatch error: {e}")
+            logger.warning("MarketWatch error: %s", e)
 
         return results
 
 
-def fetch_upcoming_ipos(max_days_ahead: int = 7) -> List[IPOData]:
-    """Convenience function to fetch IPOs from all sources."""
-    fetcher = IPODataFetcher()
-    return fetcher.fetch_all_sources(max_days_ahead)
+def filter_upcoming_ipos(ipos: List[IPOData], max_days_ahead: int = 7) -> List[IPOData]:
+    """Keep only IPOs expected between today and today + max_days_ahead."""
+    today_ordinal = datetime.now().toordinal()
+
+    valid_ipos = []
+    for ipo in ipos:
+        if not ipo.expected_date:
+            continue
+        days = ipo.expected_date.toordinal() - today_ordinal
+        if 0 <= days <= max_days_ahead:
+            valid_ipos.append(ipo)
+            logger.info(
+                "  Valid: %s (%s) - %s (%s days) [Sources: %s]",
+                ipo.symbol, ipo.company_name, ipo.format_date(), days, ", ".join(sorted(ipo.sources)),
+            )
+
+    logger.info("Total valid IPOs within %s days: %s", max_days_ahead, len(valid_ipos))
+    return valid_ipos
+
+
+def _load_cached_ipos(cache_file: Path, max_age: timedelta) -> Optional[List[IPOData]]:
+    """Load merged IPO data from the cache file if it is younger than max_age."""
+    try:
+        cache = json.loads(cache_file.read_bytes())
+        fetched_at = datetime.fromisoformat(cache["fetched_at"])
+        if datetime.now() - fetched_at > max_age:
+            return None
+        return [IPOData.from_dict(item) for item in cache["ipos"]]
+    except FileNotFoundError:
+        return None
+    except (IOError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring unreadable IPO cache %s: %s", cache_file, e)
+        return None
+
+
+def _save_cached_ipos(cache_file: Path, ipos: List[IPOData]) -> None:
+    """Save merged IPO data to the cache file (atomically)."""
+    cache = {
+        "fetched_at": datetime.now().isoformat(timespec="seconds"),
+        "ipos": [ipo.to_dict() for ipo in ipos],
+    }
+    tmp_file = cache_file.with_suffix(cache_file.suffix + ".tmp")
+    try:
+        tmp_file.write_text(json.dumps(cache, separators=(",", ":")))
+        os.replace(tmp_file, cache_file)
+    except IOError as e:
+        logger.warning("Failed to save IPO cache %s: %s", cache_file, e)
+
+
+def fetch_upcoming_ipos(
+    max_days_ahead: int = 7,
+    cache_file: Optional[Path] = None,
+    max_age: Optional[timedelta] = None,
+) -> List[IPOData]:
+    """Convenience function to fetch IPOs from all sources.
+
+    If cache_file and max_age are given, the merged calendar data is reused
+    from cache_file while it is younger than max_age instead of hitting
+    every source again. The date filter is always applied against today.
+    """
+    ipos = None
+    if cache_file is not None and max_age is not None:
+        ipos = _load_cached_ipos(cache_file, max_age)
+        if ipos is not None:
+            logger.info("Using cached IPO calendar data (%s IPOs) from %s", len(ipos), cache_file)
+
+    if ipos is None:
+        ipos = IPODataFetcher().fetch_merged()
+        # Don't cache an empty result - it usually means every source failed
+        if cache_file is not None and ipos:
+            _save_cached_ipos(cache_file, ipos)
+
+    return filter_upcoming_ipos(ipos, max_days_ahead)
@@ -1,10 +1,12 @@
 """Telegram notification module."""
 
 import logging
-from typing import Optional
+import time
+from typing import List, Optional
 
 import requests
 
+from .http_client import get_session
 from .ipo_checker import IPOInfo, IPOStatus
 from .volatility_checker import MovementType, VolatilityInfo
 from .upcoming_ipo_checker import UpcomingIPO
@@ -17,93 +19,209 @@ class TelegramNotifier:
 
     API_BASE = "https://api.telegram.org/bot"
 
-    def __init__(self, bot_token: str, chat_id: str):
+    # Telegram rejects messages longer than this many characters
+    MAX_MESSAGE_LENGTH = 4096
+
+    # Separator between alerts combined into a single message
+    ALERT_SEPARATOR = "\n\n━━━━━━━━━━\n\n"
+
+    # How many times to retry a message after a 429 (rate limited) response
+    MAX_RATE_LIMIT_RETRIES = 3
+
+    STATUS_EMOJI = {
+        IPOStatus.NOT_FOUND: "🔍",
+        IPOStatus.UPCOMING: "📅",
+        IPOStatus.SUBSCRIPTION_OPEN: "📝",
+        IPOStatus.SUBSCRIPTION_CLOSED: "🔒",
+        IPOStatus.ALLOTMENT_PENDING: "⏳",
+        IPOStatus.ALLOTMENT_DONE: "✅",
+        IPOStatus.LISTED: "🎉",
+        IPOStatus.TRADING: "📈",
+    }
+
+    STATUS_TEXT = {
+        IPOStatus.NOT_FOUND: "Not Found",
+        IPOStatus.UPCOMING: "Upcoming",
+        IPOStatus.SUBSCRIPTION_OPEN: "Subscription Open",
+        IPOStatus.SUBSCRIPTION_CLOSED: "Subscription Closed",
+        IPOStatus.ALLOTMENT_PENDING: "Allotment Pending",
+        IPOStatus.ALLOTMENT_DONE: "Allotment Complete",
+        IPOStatus.LISTED: "Listed",
+        IPOStatus.TRADING: "Trading",
+    }
+
+    # Emoji and label for each price movement
+    MOVEMENT_LABELS = {
+        MovementType.RALLY: ("🚀", "RALLY"),
+        MovementType.DROP: ("📉", "DROP"),
+    }
+
+    def __init__(self, bot_token: str, chat_id: str, session: Optional[requests.Session] = None):
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.api_url = f"{self.API_BASE}{bot_token}"
+        self.session = session or get_session()
+        self._pending: List[str] = []
 
     def send_message(self, text: str, parse_mode: str = "HTML") -> bool:
-        """Send a message to the configured chat."""
-        try:
-            url = f"{self.api_url}/sendMessage"
-            payload = {
-                "chat_id": self.chat_id,
-                "text": text,
-                "parse_mode": parse_mode,
-            }
+        """Send a message to the configured chat.
+
+        Honors Telegram's retry_after hint when rate limited (HTTP 429).
+        """
+        url = f"{self.api_url}/sendMessage"
+        payload = {
+            "chat_id": self.chat_id,
+            "text": text,
+            "parse_mode": parse_mode,
+        }
 
-            response = requests.post(url, json=payload, timeout=30)
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                response = self.session.post(url, json=payload, timeout=30)
+            except requests.RequestException as e:
+                logger.error("Failed to send Telegram message: %s", e)
+                return False
 
             if response.status_code == 200:
                 logger.info("Telegram message sent successfully")
                 return True
-            else:
-                logger.error(f"Telegram API error: {response.status_code} - {response.text}")
-                return False
 
-        except requests.RequestException as e:
-            logger.error(f"Failed to send Telegram message: {e}")
+            if response.status_code == 429 and attempt < self.MAX_RATE_LIMIT_RETRIES:
+                retry_after = self._get_retry_after(response)
+                logger.warning("Telegram rate limit hit - retrying in %ss", retry_after)
+                time.sleep(retry_after)
+                continue
+
+            logger.error("Telegram API error: %s - %s", response.status_code, response.text)
             return False
 
+        return False
+
+    def enqueue_ipo_alert(self, ipo_info: IPOInfo) -> None:
+        """Queue an IPO alert to be sent with the next flush()."""
+        self._pending.append(self.format_ipo_alert(ipo_info))
+
+    def enqueue_volatility_alert(self, vol_info: VolatilityInfo) -> None:
+        """Queue a volatility alert to be sent with the next flush()."""
+        self._pending.append(self.format_volatility_alert(vol_info))
+
+    def enqueue_upcoming_ipo_alert(self, ipo: UpcomingIPO) -> None:
+        """Queue an upcoming IPO alert to be sent with the next flush()."""
+        self._pending.append(self.format_upcoming_ipo_alert(ipo))
+
+    def has_pending(self) -> bool:
+        """Check if there are queued alerts waiting for flush()."""
+        return bool(self._pending)
+
+    def flush(self) -> bool:
+        """Send all queued alerts, combined into as few messages as possible.
+
+        Returns:
+            True if every queued alert was sent (or nothing was queued)
+        """
+        if not self._pending:
+            return True
+
+        messages = self._combine_messages(self._pending)
+        logger.info("Sending %s queued alert(s) in %s message(s)", len(self._pending), len(messages))
+        self._pending = []
+
+        success = True
+        for message in messages:
+            if not self.send_message(message):
+                success = False
+        return success
+
+    def _combine_messages(self, alerts: List[str]) -> List[str]:
+        """Join alerts into messages that fit within Telegram's length limit."""
+        messages = []
+        current = ""
+        for alert in alerts:
+            if not current:
+                current = alert
+            elif len(current) + len(self.ALERT_SEPARATOR) + len(alert) <= self.MAX_MESSAGE_LENGTH:
+                current += self.ALERT_SEPARATOR + alert
+            else:
+                messages.append(current)
+                current = alert
+        if current:
+            messages.append(current)
+        return messages
+
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> int:
+        """Get the number of seconds Telegram asks us to wait after a 429."""
+        try:
+            return int(response.json()["parameters"]["retry_after"])
+        except (ValueError, KeyError, TypeError):
+            return 1
+
     def send_ipo_alert(self, ipo_info: IPOInfo) -> bool:
         """Send a formatted IPO alert message."""
+        return self.send_message(self.format_ipo_alert(ipo_info))
+
+    def format_ipo_alert(self, ipo_info: IPOInfo) -> str:
+        """Format an IPO alert message."""
         emoji = self._get_status_emoji(ipo_info.status)
         status_text = self._get_status_text(ipo_info.status)
 
-        message = f"""
-{emoji} <b>IPO Alert: {ipo_info.symbol}</b>
-
-<b>Status:</b> {status_text}
-"""
+        lines = [
+            f"{emoji} <b>IPO Alert: {ipo_info.symbol}</b>",
+            "",
+            f"<b>Status:</b> {status_text}",
+        ]
 
         if ipo_info.company_name:
-            message += f"<b>Company:</b> {ipo_info.company_name}\n"
+            lines.append(f"<b>Company:</b> {ipo_info.company_name}")
 
         if ipo_info.exchange:
-            message += f"<b>Exchange:</b> {ipo_info.exchange}\n"
+            lines.append(f"<b>Exchange:</b> {ipo_info.exchange}")
 
         if ipo_info.listing_date:
-            message += f"<b>Listing Date:</b> {ipo_info.listing_date}\n"
+            lines.append(f"<b>Listing Date:</b> {ipo_info.listing_date}")
 
         if ipo_info.price:
-            message += f"<b>Price:</b> ${ipo_info.price}\n"
+            lines.append(f"<b>Price:</b> ${ipo_info.price}")
 
         if ipo_info.details:
-            message += f"\n<i>{ipo_info.details}</i>\n"
+            lines += ["", f"<i>{ipo_info.details}</i>"]
 
         if ipo_info.is_tradeable():
-            message += "\n<b>Shares are now available for trading!</b>"
+            lines += ["", "<b>Shares are now available for trading!</b>"]
 
-        return self.send_message(message.strip())
+        return "\n".join(lines)
 
     def send_volatility_alert(self, vol_info: VolatilityInfo) -> bool:
         """Send a formatted volatility alert message."""
-        if vol_info.movement == MovementType.RALLY:
-            emoji = "🚀"
-            movement_text = "RALLY"
-        else:
-            emoji = "📉"
-            movement_text = "DROP"
+        return self.send_message(self.format_volatility_alert(vol_info))
 
-        message = f"""
-{emoji} <b>Volatility Alert: {vol_info.symbol}</b>
+    def format_volatility_alert(self, vol_info: VolatilityInfo) -> str:
+        """Format a volatility alert message."""
+        emoji, movement_text = self.MOVEMENT_LABELS.get(vol_info.movement, self.MOVEMENT_LABELS[MovementType.DROP])
 
-<b>Movement:</b> {movement_text} ({vol_info.change_percent:+.2f}%)
-"""
+        lines = [
+            f"{emoji} <b>Volatility Alert: {vol_info.symbol}</b>",
+            "",
+            f"<b>Movement:</b> {movement_text} ({vol_info.change_percent:+.2f}%)",
+        ]
 
         if vol_info.company_name:
-            message += f"<b>Company:</b> {vol_info.company_name}\n"
+            lines.append(f"<b>Company:</b> {vol_info.company_name}")
 
         if vol_info.current_price is not None:
-            message += f"<b>Current Price:</b> {vol_info.currency} {vol_info.current_price:.2f}\n"
+            lines.append(f"<b>Current Price:</b> {vol_info.currency} {vol_info.current_price:.2f}")
 
         if vol_info.previous_price is not None:
-            message += f"<b>Previous Price:</b> {vol_info.currency} {vol_info.previous_price:.2f}\n"
+            lines.append(f"<b>Previous Price:</b> {vol_info.currency} {vol_info.previous_price:.2f}")
 
-        return self.send_message(message.strip())
+        return "\n".join(lines)
 
     def send_upcoming_ipo_alert(self, ipo: UpcomingIPO) -> bool:
         """Send a formatted upcoming IPO alert message."""
+        return self.send_message(self.format_upcoming_ipo_alert(ipo))
+
+    def format_upcoming_ipo_alert(self, ipo: UpcomingIPO) -> str:
+        """Format an upcoming IPO alert message."""
         if ipo.days_until_ipo == 0:
             emoji = "🚨"
             urgency = "IPO IS TODAY!"
@@ -114,30 +232,30 @@ class TelegramNotifier:
             emoji = "📅"
             urgency = f"IPO in {ipo.days_until_ipo} days"
 
-        message = f"""
-{emoji} <b>Upcoming IPO Alert: {ipo.symbol}</b>
-
-<b>{urgency}</b>
-"""
+        lines = [
+            f"{emoji} <b>Upcoming IPO Alert: {ipo.symbol}</b>",
+            "",
+            f"<b>{urgency}</b>",
+        ]
 
         if ipo.company_name:
-            message += f"<b>Company:</b> {ipo.company_name}\n"
+            lines.append(f"<b>Company:</b> {ipo.company_name}")
 
         if ipo.expected_date:
-            message += f"<b>Expected Date:</b> {ipo.format_date()}\n"
+            lines.append(f"<b>Expected Date:</b> {ipo.format_date()}")
 
         if ipo.exchange:
-            message += f"<b>Exchange:</b> {ipo.exchange}\n"
+            lines.append(f"<b>Exchange:</b> {ipo.exchange}")
 
         if ipo.price_range:
-            message += f"<b>Price Range:</b> {ipo.price_range}\n"
+            lines.append(f"<b>Price Range:</b> {ipo.price_range}")
 
         if ipo.shares:
-            message += f"<b>Shares Offered:</b> {ipo.shares}\n"
+            lines.append(f"<b>Shares Offered:</b> {ipo.shares}")
 
-        message += f"\n<i>Source: {ipo.source}</i>"
+        lines += ["", f"<i>Source: {ipo.source}</i>"]
 
-        return self.send_message(message.strip())
+        return "\n".join(lines)
 
     def send_status_update(self, message: str) -> bool:
         """Send a simple status update message."""
@@ -145,31 +263,11 @@ class TelegramNotifier:
 
     def _get_status_emoji(self, status: IPOStatus) -> str:
         """Get emoji for status."""
-        emoji_map = {
-            IPOStatus.NOT_FOUND: "🔍",
-            IPOStatus.UPCOMING: "📅",
-            IPOStatus.SUBSCRIPTION_OPEN: "📝",
-            IPOStatus.SUBSCRIPTION_CLOSED: "🔒",
-            IPOStatus.ALLOTMENT_PENDING: "⏳",
-            IPOStatus.ALLOTMENT_DONE: "✅",
-            IPOStatus.LISTED: "🎉",
-            IPOStatus.TRADING: "📈",
-        }
-        return emoji_map.get(status, "ℹ️")
+        return self.STATUS_EMOJI.get(status, "ℹ️")
 
     def _get_status_text(self, status: IPOStatus) -> str:
         """Get human-readable status text."""
-        text_map = {
-            IPOStatus.NOT_FOUND: "Not Found",
-            IPOStatus.UPCOMING: "Upcoming",
-            IPOStatus.SUBSCRIPTION_OPEN: "Subscription Open",
-            IPOStatus.SUBSCRIPTION_CLOSED: "Subscription Closed",
-            IPOStatus.ALLOTMENT_PENDING: "Allotment Pending",
-            IPOStatus.ALLOTMENT_DONE: "Allotment Complete",
-            IPOStatus.LISTED: "Listed",
-            IPOStatus.TRADING: "Trading",
-        }
-        return text_map.get(status, "Unknown")
+        return self.STATUS_TEXT.get(status, "Unknown")
 
 
 def send_alert(bot_token: str, chat_id: str, ipo_info: IPOInfo) -> bool:
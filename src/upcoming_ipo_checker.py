@@ -3,17 +3,22 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Set, Tuple, TYPE_CHECKING
 
 import requests
 
 if TYPE_CHECKING:
     from .config import UpcomingIPOEntry
 
-from .config import ALERT_DAYS_BEFORE
+from .config import ALERT_DAYS_BEFORE, parse_watchlist_date
+from .http_client import get_json, get_session
+from .ipo_checker import NASDAQ_CALENDAR_TTL, NASDAQ_CALENDAR_URL
 
 logger = logging.getLogger(__name__)
 
+# NASDAQ IPO calendar sections, in the order they are read
+NASDAQ_SECTIONS = ("upcoming", "priced", "filed")
+
 
 @dataclass
 class UpcomingIPO:
@@ -32,21 +37,15 @@ class UpcomingIPO:
     def format_date(self) -> str:
         """Format the expected date for display."""
         if self.expected_date:
-            return self.expected_date.strftime("%Y-%m-%d")
+            return self.expected_date.date().isoformat()
         return "TBD"
 
 
 class UpcomingIPOChecker:
     """Check for upcoming IPOs and determine if alerts should be sent."""
 
-    USER_AGENT = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.USER_AGENT})
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or get_session()
 
     def check_upcoming_ipos(self, watchlist: List["UpcomingIPOEntry"]) -> List[UpcomingIPO]:
         """Check status of upcoming IPOs.
@@ -59,8 +58,8 @@ class UpcomingIPOChecker:
         """
         results = []
 
-        # Fetch NASDAQ IPO calendar data
-        nasdaq_data = self._fetch_nasdaq_calendar()
+        # Fetch NASDAQ IPO calendar data (only the watchlist symbols are looked up)
+        nasdaq_data = self._fetch_nasdaq_calendar(wanted={entry.symbol for entry in watchlist})
 
         today = datetime.now().date()
 
@@ -105,22 +104,12 @@ class UpcomingIPOChecker:
                 date_str = nasdaq_info["expected_date"]
 
         # Parse expected date
-        if date_str:
-            try:
-                ipo.expected_date = datetime.strptime(date_str, "%Y-%m-%d")
-            except ValueError:
-                # Try other date formats
-                for fmt in ["%m/%d/%Y", "%m/%d/%y", "%Y/%m/%d"]:
-                    try:
-                        ipo.expected_date = datetime.strptime(date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
+        ipo_date = parse_watchlist_date(date_str) if date_str else None
 
         # Calculate days until IPO and determine if alert needed
-        if ipo.expected_date:
-            delta = ipo.expected_date.date() - today
-            ipo.days_until_ipo = delta.days
+        if ipo_date:
+            ipo.expected_date = datetime.combine(ipo_date, datetime.min.time())
+            ipo.days_until_ipo = (ipo_date - today).days
 
             # Alert if IPO is within ALERT_DAYS_BEFORE days (and not in the past)
             if 0 <= ipo.days_until_ipo <= ALERT_DAYS_BEFORE:
@@ -128,72 +117,87 @@ class UpcomingIPOChecker:
 
         return ipo
 
-    def _fetch_nasdaq_calendar(self) -> dict:
-        """Fetch IPO calendar from NASDAQ API."""
+    def _fetch_nasdaq_calendar(
+        self,
+        wanted: Optional[Set[str]] = None,
+        sections: Tuple[str, ...] = NASDAQ_SECTIONS,
+    ) -> dict:
+        """Fetch IPO calendar from NASDAQ API.
+
+        Args:
+            wanted: Only include these symbols (None includes every row)
+            sections: Calendar sections to read, later sections win for a symbol
+        """
         result = {}
 
         try:
-            url = "https://api.nasdaq.com/api/ipo/calendar"
-            response = self.session.get(url, timeout=15)
+            data = get_json(NASDAQ_CALENDAR_URL, ttl=NASDAQ_CALENDAR_TTL, session=self.session)
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
+                calendar = data.get("data") or {}
 
-                # Process upcoming, priced, and filed sections
-                for section in ["upcoming", "priced", "filed"]:
-                    rows = data.get("data", {}).get(section, {}).get("rows", []) or []
+                # Process the requested sections (upcoming, priced, and/or filed)
+                for section in sections:
+                    rows = (calendar.get(section) or {}).get("rows") or []
                     for row in rows:
-                        symbol = (row.get("proposedTickerSymbol") or "").upper()
-                        if symbol:
-                            # Parse date
-                            date_str = row.get("expectedPriceDate") or row.get("pricedDate")
-                            expected_date = None
-                            if date_str:
-                                try:
-                                    expected_date = datetime.strptime(date_str, "%m/%d/%Y").strftime("%Y-%m-%d")
-                                except ValueError:
-                                    expected_date = date_str
-
-                            result[symbol] = {
-                                "company_name": row.get("companyName"),
-                                "expected_date": expected_date,
-                                "exchange": "NASDAQ",
-                                "price_range": row.get("proposedSharePrice"),
-                                "shares": row.get("sharesOffered"),
-                                "section": section,
-                            }
+                        symbol = row.get("proposedTickerSymbol")
+                        if not symbol:
+                            continue
+                        symbol = symbol.upper()
+                        if wanted is not None and symbol not in wanted:
+                            continue
+
+                        # Parse date
+                        date_str = row.get("expectedPriceDate") or row.get("pricedDate")
+                        expected_date = None
+                        if date_str:
+                            parsed_date = parse_watchlist_date(date_str)
+                            expected_date = parsed_date.isoformat() if parsed_date else date_str
+
+                        result[symbol] = {
+                            "company_name": row.get("companyName"),
+                            "expected_date": expected_date,
+                            "exchange": "NASDAQ",
+                            "price_range": row.get("proposedSharePrice"),
+                            "shares": row.get("sharesOffered"),
+                            "section": section,
+                        }
 
         except requests.RequestException as e:
-            logger.warning(f"Failed to fetch NASDAQ IPO calendar: {e}")
+            logger.warning("Failed to fetch NASDAQ IPO calendar: %s", e)
 
         return result
 
     def fetch_all_upcoming(self) -> List[UpcomingIPO]:
         """Fetch all upcoming IPOs from NASDAQ (for discovery)."""
         results = []
+        # Every section is read so an IPO that has since priced (listed under
+        # "priced" as well) is recognized and left out
         nasdaq_data = self._fetch_nasdaq_calendar()
         today = datetime.now().date()
 
         for symbol, info in nasdaq_data.items():
-            if info.get("section") in ["upcoming", "filed"]:
-                ipo = UpcomingIPO(
-                    symbol=symbol,
-                    company_name=info.get("company_name"),
-                    exchange=info.get("exchange"),
-                    price_range=info.get("price_range"),
-                    shares=info.get("shares"),
-                    source="NASDAQ",
-                )
-
-                if info.get("expected_date"):
-                    try:
-                        ipo.expected_date = datetime.strptime(info["expected_date"], "%Y-%m-%d")
-                        delta = ipo.expected_date.date() - today
-                        ipo.days_until_ipo = delta.days
-                    except ValueError:
-                        pass
-
-                results.append(ipo)
+            if info.get("section") not in ("upcoming", "filed"):
+                continue
+
+            ipo = UpcomingIPO(
+                symbol=symbol,
+                company_name=info.get("company_name"),
+                exchange=info.get("exchange"),
+                price_range=info.get("price_range"),
+                shares=info.get("shares"),
+                source="NASDAQ",
+            )
+
+            if info.get("expected_date"):
+                try:
+                    ipo.expected_date = datetime.fromisoformat(info["expected_date"])
+                    delta = ipo.expected_date.date() - today
+                    ipo.days_until_ipo = delta.days
+                except ValueError:
+                    pass
+
+            results.append(ipo)
 
         return results
 
@@ -7,6 +7,8 @@ from typing import Optional
 
 import requests
 
+from .http_client import HTTP_TIMEOUT, get_session
+
 logger = logging.getLogger(__name__)
 
 # Alert threshold - percentage change to trigger alert
@@ -42,15 +44,9 @@ class VolatilityInfo:
 class VolatilityChecker:
     """Check price volatility for stocks and crypto."""
 
-    USER_AGENT = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-
-    def __init__(self, symbol: str):
+    def __init__(self, symbol: str, session: Optional[requests.Session] = None):
         self.symbol = symbol.upper()
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.USER_AGENT})
+        self.session = session or get_session()
 
     def check_volatility(self, previous_price: Optional[float] = None) -> VolatilityInfo:
         """Check current price and compare with previous price."""
@@ -64,11 +60,10 @@ class VolatilityChecker:
             # First run or no price - return current info without movement
             return price_info
 
-        # Calculate percentage change
+        # Calculate percentage change (kept unrounded, it's rounded when displayed)
         price_info.previous_price = previous_price
-        change = price_info.current_price - previous_price
-        change_percent = (change / previous_price) * 100
-        price_info.change_percent = round(change_percent, 2)
+        change_percent = (price_info.current_price - previous_price) / previous_price * 100
+        price_info.change_percent = change_percent
 
         # Determine movement type
         if change_percent >= VOLATILITY_THRESHOLD_PERCENT:
@@ -83,11 +78,17 @@ class VolatilityChecker:
         try:
             url = f"https://query1.finance.yahoo.com/v8/finance/chart/{self.symbol}"
             params = {"interval": "1d", "range": "1d"}
-            response = self.session.get(url, params=params, timeout=15)
+            response = self.session.get(url, params=params, timeout=HTTP_TIMEOUT)
 
-            if response.status_code == 200:
+            # Parsed once and shared by the success and error paths below
+            try:
                 data = response.json()
-                result = data.get("chart", {}).get("result")
+            except ValueError:
+                data = None
+            chart = (data.get("chart") or {}) if isinstance(data, dict) else {}
+
+            if response.status_code == 200:
+                result = chart.get("result")
 
                 if result and len(result) > 0:
                     meta = result[0].get("meta", {})
@@ -111,19 +112,16 @@ class VolatilityChecker:
                             currency=currency,
                         )
 
-            # Handle error response
-            try:
-                data = response.json()
-                error = data.get("chart", {}).get("error", {})
+            # Handle error response (a chart without an "error" entry counts as an unknown error)
+            error = chart.get("error", {}) if isinstance(data, dict) else None
+            if isinstance(error, dict):
                 error_desc = error.get("description", "Unknown error")
                 return VolatilityInfo(symbol=self.symbol, error=error_desc)
-            except Exception:
-                pass
 
             return VolatilityInfo(symbol=self.symbol, error="Failed to fetch price data")
 
         except requests.RequestException as e:
-            logger.warning(f"Yahoo Finance API check failed for {self.symbol}: {e}")
+            logger.warning("Yahoo Finance API check failed for %s: %s", self.symbol, e)
             return VolatilityInfo(symbol=self.symbol, error=str(e))
 
 